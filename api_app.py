@@ -1,271 +1,379 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request
 from flask_cors import CORS
 import sqlite3
 import csv
 import os
-import tempfile
-import json
+import io
+import orjson
+import hashlib
+import gzip
+import zlib
 import re
+import threading
+from collections import Counter, OrderedDict, defaultdict
 from datetime import datetime
-from werkzeug.utils import secure_filename
+from streaming_form_data import StreamingFormDataParser
+from streaming_form_data.parser import ParseFailedException
+from streaming_form_data.targets import ValueTarget
 import logging
 
 app = Flask(__name__)
 CORS(app)
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter('%(levelname)s:%(name)s:%(message)s'))
+logger.addHandler(_log_handler)
+logger.setLevel(logging.INFO)
+logger.propagate = False
 
-UPLOAD_FOLDER = '/tmp'
-ALLOWED_EXTENSIONS = {'csv'}
+ALLOWED_EXTENSIONS = frozenset({'csv'})
 MAX_CONTENT_LENGTH = 16 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+UPLOAD_FIELDS = ('data_quality_file', 'system_codes_file')
+FAILED_STATUSES = frozenset({'FAIL', 'ERROR'})
+RESULTS_CACHE_SIZE = 128
+CONFIG_CACHE_SIZE = 32
+GZIP_LEVEL = 6
+SAMPLE_DB_PRAGMAS = (
+    "PRAGMA journal_mode=OFF",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA query_only=ON",
+)
 
-app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = MAX_CONTENT_LENGTH
 
+def read_source(source) -> bytes:
+    """Read all bytes from raw bytes, a file path or a binary file-like object."""
+    if isinstance(source, bytes):
+        return source
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as file:
+            return file.read()
+    return source.read()
+
+def csv_text(data: bytes):
+    """Wrap raw CSV bytes as UTF-8 text with universal newlines, as open() would."""
+    return io.TextIOWrapper(io.BytesIO(data), encoding='utf-8')
+
+def config_digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+class LRUCache:
+    """Small thread-safe LRU mapping; get() returns None on a miss."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+            return payload
+
+    def put(self, key, payload):
+        with self._lock:
+            self._entries[key] = payload
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+# Parsed configuration CSVs keyed by content digest; entries are shared, never mutated
+_checks_config_cache = LRUCache(CONFIG_CACHE_SIZE)
+_system_codes_config_cache = LRUCache(CONFIG_CACHE_SIZE)
+
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+CHECK_FLAGS = (
+    'special_characters_check', 'null_check', 'blank_check', 'max_value_check',
+    'min_value_check', 'max_count_check', 'email_check', 'numeric_check',
+    'system_codes_check', 'language_check', 'phone_number_check', 'duplicate_check',
+    'date_check'
+)
+# Each field's enabled checks are stored as a bitmask over CHECK_FLAGS
+CHECK_BITS = {flag: 1 << position for position, flag in enumerate(CHECK_FLAGS)}
+NULL_CHECK = CHECK_BITS['null_check']
+BLANK_CHECK = CHECK_BITS['blank_check']
+EMAIL_CHECK = CHECK_BITS['email_check']
+
+def quote_identifier(name: str) -> str:
+    """Quote a schema-validated table or column name for interpolation into SQL."""
+    return '"' + name.replace('"', '""') + '"'
+
+def _invalid_email(value):
+    """SQLite function: 1 when a stored value is not a valid email address."""
+    return _EMAIL_RE.match(str(value).strip()) is None
+
 # Extract essential classes from your original file
 class DataQualityChecker:
     def __init__(self, db_connection):
         self.db_connection = db_connection
+        db_connection.create_function('dq_invalid_email', 1, _invalid_email, deterministic=True)
         self.checks_config = {}
         self.system_codes_config = {}
-
-    def load_checks_config(self, csv_file_path: str) -> bool:
+        # Schema introspection, loaded on first use
+        self._tables = None
+        self._columns = {}
+
+    @staticmethod
+    def _parse_checks_config(data: bytes) -> dict:
+        checks_config = {}
+        with csv_text(data) as file:
+            reader = csv.reader(file)
+            header = next(reader, None)
+            rows = [row for row in reader if row]
+            if not rows:
+                return checks_config
+            
+            # Resolve column positions once; short rows read as None, like DictReader
+            width = len(header)
+            index = {name: position for position, name in enumerate(header)}
+            # 'description' is required in the file but not used by any check
+            table_i, field_i, _ = index['table_name'], index['field_name'], index['description']
+            flag_positions = [(CHECK_BITS[flag], index[flag]) for flag in CHECK_FLAGS]
+            for row in rows:
+                if len(row) < width:
+                    row += [None] * (width - len(row))
+                flags = 0
+                for bit, position in flag_positions:
+                    if row[position] == '1':
+                        flags |= bit
+                checks_config.setdefault(row[table_i], {})[row[field_i]] = flags
+        return checks_config
+
+    @staticmethod
+    def _parse_system_codes_config(data: bytes) -> dict:
+        system_codes_config = {}
+        with csv_text(data) as file:
+            reader = csv.reader(file)
+            header = next(reader, None)
+            rows = [row for row in reader if row]
+            if not rows:
+                return system_codes_config
+            
+            width = len(header)
+            index = {name: position for position, name in enumerate(header)}
+            table_i, field_i, codes_i = index['table_name'], index['field_name'], index['valid_codes']
+            for row in rows:
+                if len(row) < width:
+                    row += [None] * (width - len(row))
+                valid_codes = [code.strip() for code in row[codes_i].split(',') if code.strip()]
+                system_codes_config.setdefault(row[table_i], {})[row[field_i]] = valid_codes
+        return system_codes_config
+
+    def load_checks_config(self, csv_source) -> bool:
         try:
-            with open(csv_file_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    table_name = row['table_name']
-                    field_name = row['field_name']
-                    if table_name not in self.checks_config:
-                        self.checks_config[table_name] = {}
-                    self.checks_config[table_name][field_name] = {
-                        'description': row['description'],
-                        'special_characters_check': row['special_characters_check'] == '1',
-                        'null_check': row['null_check'] == '1',
-                        'blank_check': row['blank_check'] == '1',
-                        'max_value_check': row['max_value_check'] == '1',
-                        'min_value_check': row['min_value_check'] == '1',
-                        'max_count_check': row['max_count_check'] == '1',
-                        'email_check': row['email_check'] == '1',
-                        'numeric_check': row['numeric_check'] == '1',
-                        'system_codes_check': row['system_codes_check'] == '1',
-                        'language_check': row['language_check'] == '1',
-                        'phone_number_check': row['phone_number_check'] == '1',
-                        'duplicate_check': row['duplicate_check'] == '1',
-                        'date_check': row['date_check'] == '1'
-                    }
+            data = read_source(csv_source)
+            key = config_digest(data)
+            parsed = _checks_config_cache.get(key)
+            if parsed is None:
+                parsed = self._parse_checks_config(data)
+                _checks_config_cache.put(key, parsed)
+            for table_name, fields in parsed.items():
+                self.checks_config.setdefault(table_name, {}).update(fields)
             return True
         except Exception as e:
-            logger.error(f"Error loading checks configuration: {str(e)}")
+            logger.error("Error loading checks configuration: %s", e)
             return False
 
-    def load_system_codes_config(self, csv_file_path: str) -> bool:
+    def load_system_codes_config(self, csv_source) -> bool:
         try:
             self.system_codes_config = {}
-            with open(csv_file_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    table_name = row['table_name']
-                    field_name = row['field_name']
-                    valid_codes_str = row['valid_codes']
-                    valid_codes = [code.strip() for code in valid_codes_str.split(',') if code.strip()]
-                    
-                    if table_name not in self.system_codes_config:
-                        self.system_codes_config[table_name] = {}
-                    self.system_codes_config[table_name][field_name] = valid_codes
+            data = read_source(csv_source)
+            key = config_digest(data)
+            parsed = _system_codes_config_cache.get(key)
+            if parsed is None:
+                parsed = self._parse_system_codes_config(data)
+                _system_codes_config_cache.put(key, parsed)
+            self.system_codes_config = {table_name: dict(fields) for table_name, fields in parsed.items()}
             return True
         except Exception as e:
-            logger.error(f"Error loading system codes configuration: {str(e)}")
+            logger.error("Error loading system codes configuration: %s", e)
             return False
 
     def _table_exists(self, table_name: str) -> bool:
-        try:
-            cursor = self.db_connection.cursor()
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name=?", (table_name,))
-            return cursor.fetchone() is not None
-        except sqlite3.Error:
-            return False
+        if self._tables is None:
+            try:
+                cursor = self.db_connection.cursor()
+                cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+                self._tables = {row[0] for row in cursor.fetchall()}
+            except sqlite3.Error:
+                return False
+        return table_name in self._tables
 
     def _column_exists(self, table_name: str, column_name: str) -> bool:
-        try:
-            cursor = self.db_connection.cursor()
-            cursor.execute(f"PRAGMA table_info({table_name})")
-            columns = [row[1] for row in cursor.fetchall()]
-            return column_name in columns
-        except sqlite3.Error:
-            return False
-
-    def _is_numeric(self, value: str) -> bool:
-        try:
-            float(value)
-            return True
-        except ValueError:
-            return False
-
-    def _is_valid_email(self, email: str) -> bool:
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(email_pattern, email) is not None
-
-    def _is_valid_phone(self, phone: str) -> bool:
-        cleaned_phone = re.sub(r'[^\d+]', '', phone)
-        if len(cleaned_phone) < 10 or len(cleaned_phone) > 15:
-            return False
-        phone_pattern = r'^\+?[1-9]\d{9,14}$'
-        return re.match(phone_pattern, cleaned_phone) is not None
-
-    def _is_valid_date(self, date_str: str) -> bool:
-        date_formats = [
-            '%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%Y-%m-%d %H:%M:%S',
-            '%m-%d-%Y', '%d-%m-%Y', '%Y/%m/%d', '%d.%m.%Y',
-            '%Y', '%m/%Y', '%Y-%m'
-        ]
-        for fmt in date_formats:
+        columns = self._columns.get(table_name)
+        if columns is None:
             try:
-                datetime.strptime(str(date_str), fmt)
-                return True
-            except ValueError:
-                continue
-        return False
-
-    def _has_special_characters(self, text: str) -> bool:
-        allowed_pattern = r'^[a-zA-Z0-9\s.,@_-]+$'
-        return not re.match(allowed_pattern, text)
-
-    def _has_non_ascii_characters(self, text: str) -> bool:
-        try:
-            text.encode('ascii')
-            return False
-        except UnicodeEncodeError:
-            return True
+                cursor = self.db_connection.cursor()
+                cursor.execute(f"PRAGMA table_info({quote_identifier(table_name)})")
+                columns = {row[1] for row in cursor.fetchall()}
+            except sqlite3.Error:
+                columns = set()
+            self._columns[table_name] = columns
+        return column_name in columns
+
+    def _column_missing_result(self, table_name: str, field_name: str) -> dict:
+        return {
+            'table': table_name,
+            'field': field_name,
+            'check_type': 'column_existence',
+            'status': 'FAIL',
+            'message': f"Column '{field_name}' does not exist in table '{table_name}'"
+        }
 
-    def _looks_like_system_code(self, code: str) -> bool:
-        patterns = [
-            r'^[A-F0-9]{8}-[A-F0-9]{4}-[A-F0-9]{4}-[A-F0-9]{4}-[A-F0-9]{12}$',
-            r'^[A-Z]{2,3}\d{3,}$',
-            r'^\d{6,}$',
-            r'^[A-Z0-9]{8,}$',
-        ]
-        for pattern in patterns:
-            if re.match(pattern, code.upper()):
-                return True
-        return False
-
-    def _get_valid_system_codes(self, table_name: str, field_name: str) -> list:
-        return self.system_codes_config.get(table_name, {}).get(field_name, [])
-
-    def _run_field_checks(self, table_name: str, field_name: str, checks: dict) -> list:
+    def _field_aggregates(self, field_name: str, checks: int) -> list:
+        """SQL aggregates for every enabled check on a field, in the order _field_results consumes them."""
+        column = quote_identifier(field_name)
+        # SUM is NULL over no rows; IS '' stays 0/1 on NULL values where = '' would be NULL
+        aggregates = []
+        if checks & NULL_CHECK:
+            aggregates.append(f"COALESCE(SUM({column} IS NULL), 0)")
+        if checks & BLANK_CHECK:
+            aggregates.append(f"COALESCE(SUM({column} IS ''), 0)")
+        if checks & EMAIL_CHECK:
+            aggregates.append(f"COALESCE(SUM({column} IS NOT NULL AND {column} != ''), 0)")
+            # CASE guarantees the email function only runs on non-blank values; AND does not short-circuit
+            aggregates.append(f"COALESCE(SUM(CASE WHEN {column} IS NOT NULL AND {column} != '' THEN dq_invalid_email({column}) ELSE 0 END), 0)")
+        return aggregates
+
+    def _field_results(self, table_name: str, field_name: str, checks: int, total_rows: int, counts) -> list:
         results = []
-        
-        if not self._column_exists(table_name, field_name):
+
+        if total_rows == 0:
             results.append({
                 'table': table_name,
                 'field': field_name,
-                'check_type': 'column_existence',
-                'status': 'FAIL',
-                'message': f"Column '{field_name}' does not exist in table '{table_name}'"
+                'check_type': 'data_existence',
+                'status': 'WARNING',
+                'message': f"Table '{table_name}' has no data"
             })
             return results
 
-        try:
-            cursor = self.db_connection.cursor()
-            cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-            total_rows = cursor.fetchone()[0]
+        # Null check
+        if checks & NULL_CHECK:
+            null_count = next(counts)
+            if null_count > 0:
+                results.append({
+                    'table': table_name,
+                    'field': field_name,
+                    'check_type': 'null_check',
+                    'status': 'FAIL',
+                    'message': f"Found {null_count} NULL values out of {total_rows} total rows"
+                })
+            else:
+                results.append({
+                    'table': table_name,
+                    'field': field_name,
+                    'check_type': 'null_check',
+                    'status': 'PASS',
+                    'message': f"No NULL values found"
+                })
 
-            if total_rows == 0:
+        # Blank check
+        if checks & BLANK_CHECK:
+            blank_count = next(counts)
+            if blank_count > 0:
+                results.append({
+                    'table': table_name,
+                    'field': field_name,
+                    'check_type': 'blank_check',
+                    'status': 'FAIL',
+                    'message': f"Found {blank_count} blank values out of {total_rows} total rows"
+                })
+            else:
                 results.append({
                     'table': table_name,
                     'field': field_name,
-                    'check_type': 'data_existence',
-                    'status': 'WARNING',
-                    'message': f"Table '{table_name}' has no data"
+                    'check_type': 'blank_check',
+                    'status': 'PASS',
+                    'message': f"No blank values found"
                 })
-                return results
 
-            # Null check
-            if checks.get('null_check', False):
-                cursor.execute(f"SELECT COUNT(*) FROM {table_name} WHERE {field_name} IS NULL")
-                null_count = cursor.fetchone()[0]
-                if null_count > 0:
+        # Email check
+        if checks & EMAIL_CHECK:
+            non_null_count = next(counts)
+            invalid_count = next(counts)
+            if non_null_count > 0:
+                if invalid_count:
                     results.append({
                         'table': table_name,
                         'field': field_name,
-                        'check_type': 'null_check',
+                        'check_type': 'email_check',
                         'status': 'FAIL',
-                        'message': f"Found {null_count} NULL values out of {total_rows} total rows"
+                        'message': f"Found {invalid_count} invalid email formats out of {non_null_count} values"
                     })
                 else:
                     results.append({
                         'table': table_name,
                         'field': field_name,
-                        'check_type': 'null_check',
+                        'check_type': 'email_check',
                         'status': 'PASS',
-                        'message': f"No NULL values found"
+                        'message': f"All {non_null_count} email formats appear valid"
                     })
 
-            # Blank check
-            if checks.get('blank_check', False):
-                cursor.execute(f"SELECT COUNT(*) FROM {table_name} WHERE {field_name} = ''")
-                blank_count = cursor.fetchone()[0]
-                if blank_count > 0:
-                    results.append({
-                        'table': table_name,
-                        'field': field_name,
-                        'check_type': 'blank_check',
-                        'status': 'FAIL',
-                        'message': f"Found {blank_count} blank values out of {total_rows} total rows"
-                    })
-                else:
-                    results.append({
-                        'table': table_name,
-                        'field': field_name,
-                        'check_type': 'blank_check',
-                        'status': 'PASS',
-                        'message': f"No blank values found"
-                    })
+        # Add other checks (phone, date, numeric, etc.) following the same pattern...
 
-            # Email check
-            if checks.get('email_check', False):
-                cursor.execute(f"SELECT COUNT(*) FROM {table_name} WHERE {field_name} IS NOT NULL AND {field_name} != ''")
-                non_null_count = cursor.fetchone()[0]
-                if non_null_count > 0:
-                    cursor.execute(f"SELECT {field_name} FROM {table_name} WHERE {field_name} IS NOT NULL AND {field_name} != ''")
-                    values = cursor.fetchall()
-                    invalid_emails = []
-                    for value in values:
-                        email = str(value[0]).strip()
-                        if not self._is_valid_email(email):
-                            invalid_emails.append(email)
-                    
-                    if invalid_emails:
-                        results.append({
-                            'table': table_name,
-                            'field': field_name,
-                            'check_type': 'email_check',
-                            'status': 'FAIL',
-                            'message': f"Found {len(invalid_emails)} invalid email formats out of {non_null_count} values"
-                        })
-                    else:
-                        results.append({
-                            'table': table_name,
-                            'field': field_name,
-                            'check_type': 'email_check',
-                            'status': 'PASS',
-                            'message': f"All {non_null_count} email formats appear valid"
-                        })
-
-            # Add other checks (phone, date, numeric, etc.) following the same pattern...
+        return results
+
+    def _run_field_checks(self, table_name: str, field_name: str, checks: int) -> list:
+        if not self._column_exists(table_name, field_name):
+            return [self._column_missing_result(table_name, field_name)]
 
+        aggregates = self._field_aggregates(field_name, checks)
+        try:
+            cursor = self.db_connection.cursor()
+            cursor.execute(f"SELECT {', '.join(['COUNT(*)'] + aggregates)} FROM {quote_identifier(table_name)}")
+            counts = iter(cursor.fetchone())
+            return self._field_results(table_name, field_name, checks, next(counts), counts)
         except sqlite3.Error as e:
-            results.append({
+            return [{
                 'table': table_name,
                 'field': field_name,
                 'check_type': 'database_error',
                 'status': 'ERROR',
                 'message': f"Database error: {str(e)}"
-            })
+            }]
+
+    def _run_table_checks(self, table_name: str, fields: dict) -> list:
+        """Run every field's checks for a table in a single scan.
+
+        Falls back to one query per field if the fused query fails, so a bad
+        field only produces its own database_error result.
+        """
+        present = {
+            field_name: self._field_aggregates(field_name, checks)
+            for field_name, checks in fields.items()
+            if self._column_exists(table_name, field_name)
+        }
 
-        return results
+        aggregates = ['COUNT(*)']
+        for field_aggregates in present.values():
+            aggregates.extend(field_aggregates)
+        try:
+            cursor = self.db_connection.cursor()
+            cursor.execute(f"SELECT {', '.join(aggregates)} FROM {quote_identifier(table_name)}")
+            counts = iter(cursor.fetchone())
+            total_rows = next(counts)
+        except sqlite3.Error:
+            return [
+                result
+                for field_name, checks in fields.items()
+                for result in self._run_field_checks(table_name, field_name, checks)
+            ]
+
+        table_results = []
+        for field_name, checks in fields.items():
+            if field_name not in present:
+                table_results.append(self._column_missing_result(table_name, field_name))
+                continue
+            field_counts = iter([next(counts) for _ in present[field_name]])
+            table_results.extend(self._field_results(table_name, field_name, checks, total_rows, field_counts))
+        return table_results
 
     def run_all_checks(self) -> dict:
         if not self.checks_config:
@@ -276,26 +384,113 @@ class DataQualityChecker:
             if not self._table_exists(table_name):
                 continue
             
-            table_results = []
-            for field_name, checks in fields.items():
-                field_results = self._run_field_checks(table_name, field_name, checks)
-                if field_results:
-                    table_results.extend(field_results)
-            
+            table_results = self._run_table_checks(table_name, fields)
             if table_results:
                 results[table_name] = table_results
         
         return results
 
-def allowed_file(filename):
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+def _json(obj, status=200):
+    return Response(orjson.dumps(obj), status=status, mimetype='application/json')
+
+def _stream_json(payload):
+    """Yield the JSON encoding of a check payload, one results table at a time."""
+    separator = b'{'
+    for key, value in payload.items():
+        yield separator + orjson.dumps(key) + b':'
+        separator = b','
+        if key == 'results' and value:
+            table_separator = b'{'
+            for table_name, table_results in value.items():
+                yield table_separator + orjson.dumps(table_name) + b':' + orjson.dumps(table_results)
+                table_separator = b','
+            yield b'}'
+        else:
+            yield orjson.dumps(value)
+    yield b'}'
+
+def _accepts_gzip():
+    return request.accept_encodings['gzip'] > 0
+
+def _gzip_stream(chunks):
+    """Gzip a stream of byte chunks on the fly."""
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+_ERRORS = {
+    code: (orjson.dumps({"success": False, "error": message, "code": code}), status)
+    for code, message, status in (
+        ('MISSING_FILES', "Both data_quality_file and system_codes_file are required", 400),
+        ('EMPTY_FILENAMES', "Both files must have valid filenames", 400),
+        ('INVALID_FILE_TYPE', "Only CSV files are allowed", 400),
+        ('FILE_TOO_LARGE', "File too large. Maximum size is 16MB.", 413),
+        ('NOT_FOUND', "Endpoint not found", 404),
+        ('INTERNAL_ERROR', "Internal server error", 500),
+    )
+}
+
+def _error(code):
+    """Build a response from a pre-serialized error body.
+
+    A new Response is made per call because after_request hooks (CORS) mutate headers.
+    """
+    body, status = _ERRORS[code]
+    return Response(body, status=status, mimetype='application/json')
+
+_EXTENSION_RE = re.compile(r'\.([^.]*)$')
 
-def create_sample_database(db_path):
-    try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
+def allowed_file(filename):
+    match = _EXTENSION_RE.search(filename)
+    return match is not None and match.group(1).lower() in ALLOWED_EXTENSIONS
+
+def stream_uploads():
+    """Parse the multipart request body into one in-memory buffer per upload field.
+
+    Returns the targets that actually received a file part, keyed by field name.
+    """
+    parser = StreamingFormDataParser(headers=request.headers)
+    targets = {}
+    for field_name in UPLOAD_FIELDS:
+        targets[field_name] = ValueTarget()
+        parser.register(field_name, targets[field_name])
+    
+    stream = request.stream
+    while True:
+        chunk = stream.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        parser.data_received(chunk)
+    
+    return {name: target for name, target in targets.items() if target.multipart_filename is not None}
+
+# Check payloads keyed by the digests of the uploaded CSVs
+results_cache = LRUCache(RESULTS_CACHE_SIZE)
+
+def _build_sample_template():
+    """Build the canonical sample database once, in memory."""
+    template = sqlite3.connect(':memory:', check_same_thread=False)
+    # Throwaway fixture: no rollback journal, no syncs
+    template.executescript(
+        "PRAGMA journal_mode=OFF; PRAGMA synchronous=OFF; PRAGMA temp_store=MEMORY;"
+    )
+    
+    # Constant tuple of rows is folded at compile time; nothing is materialized per call
+    sample_data = (
+        (1, 'John Doe', 'john.doe@company.com', '555-0123', 'IT001', 75000, '2023-01-15', 'ACTIVE'),
+        (2, 'Jane Smith', 'jane.smith@company', '555-0124', 'HR002', 65000, '2023-02-01', 'ACTIVE'),  # Invalid email
+        (3, '', 'bob.wilson@company.com', '555-0125', 'FIN003', 80000, '2023-03-01', 'ACTIVE'),  # Empty name
+        (4, 'Alice Brown', 'alice.brown@company.com', '123', 'IT001', -5000, '2023-04-01', 'INACTIVE'),  # Invalid phone, negative salary
+        (5, 'Mike Davis', 'mike.davis@company.com', '555-0127', 'INVALID', 70000, 'invalid-date', 'ACTIVE'),  # Invalid dept code, invalid date
+    )
+    
+    # One transaction for DDL + inserts, committed (or rolled back) on exit
+    with template:
+        template.execute("BEGIN")
+        template.execute('''
             CREATE TABLE IF NOT EXISTS employees (
                 id INTEGER PRIMARY KEY,
                 name TEXT,
@@ -307,31 +502,131 @@ def create_sample_database(db_path):
                 status TEXT
             )
         ''')
-        
-        sample_data = [
-            (1, 'John Doe', 'john.doe@company.com', '555-0123', 'IT001', 75000, '2023-01-15', 'ACTIVE'),
-            (2, 'Jane Smith', 'jane.smith@company', '555-0124', 'HR002', 65000, '2023-02-01', 'ACTIVE'),  # Invalid email
-            (3, '', 'bob.wilson@company.com', '555-0125', 'FIN003', 80000, '2023-03-01', 'ACTIVE'),  # Empty name
-            (4, 'Alice Brown', 'alice.brown@company.com', '123', 'IT001', -5000, '2023-04-01', 'INACTIVE'),  # Invalid phone, negative salary
-            (5, 'Mike Davis', 'mike.davis@company.com', '555-0127', 'INVALID', 70000, 'invalid-date', 'ACTIVE'),  # Invalid dept code, invalid date
-        ]
-        
-        cursor.executemany('''
+        template.executemany('''
             INSERT OR REPLACE INTO employees 
             (id, name, email, phone, department_code, salary, hire_date, status) 
             VALUES (?, ?, ?, ?, ?, ?, ?, ?)
         ''', sample_data)
-        
-        conn.commit()
-        conn.close()
-        return True
+    return template
+
+_SAMPLE_TEMPLATE = _build_sample_template()
+_SAMPLE_TEMPLATE_LOCK = threading.Lock()
+_thread_state = threading.local()
+
+def create_sample_database():
+    """Return this thread's read-only copy of the sample database, or None on failure."""
+    conn = getattr(_thread_state, 'sample_db', None)
+    if conn is not None:
+        return conn
+    try:
+        conn = sqlite3.connect(':memory:')
+        with _SAMPLE_TEMPLATE_LOCK:
+            _SAMPLE_TEMPLATE.backup(conn)
+        for pragma in SAMPLE_DB_PRAGMAS:
+            conn.execute(pragma)
+        _thread_state.sample_db = conn
+        return conn
     except Exception as e:
-        logger.error(f"Error creating sample database: {str(e)}")
-        return False
+        logger.error("Error creating sample database: %s", e)
+        return None
+
+def run_checks(dq_source, sc_source):
+    """Run the uploaded checks against this thread's copy of the sample database.
+
+    Returns the response payload (without timestamp) and its HTTP status.
+    """
+    # Sample database for testing
+    conn = create_sample_database()
+    if conn is None:
+        return {
+            "success": False,
+            "error": "Failed to create sample database",
+            "code": "DATABASE_ERROR"
+        }, 500
+    
+    # Initialize data quality checker
+    checker = DataQualityChecker(conn)
+    
+    # Load configurations
+    if not checker.load_checks_config(dq_source):
+        return {
+            "success": False,
+            "error": "Failed to load data quality checks configuration",
+            "code": "CONFIG_LOAD_ERROR"
+        }, 400
+    
+    if not checker.load_system_codes_config(sc_source):
+        return {
+            "success": False,
+            "error": "Failed to load system codes configuration", 
+            "code": "SYSTEM_CODES_LOAD_ERROR"
+        }, 400
+    
+    # Run data quality checks
+    results = checker.run_all_checks()
+    
+    if not results:
+        return {
+            "success": True,
+            "message": "No data quality issues found",
+            "results": {},
+            "summary": {
+                "total_checks": 0,
+                "passed_checks": 0,
+                "failed_checks": 0,
+                "warnings": 0,
+                "tables_checked": 0
+            }
+        }, 200
+    
+    # Process results for JSON response and failed fields summary in one pass
+    json_results = {}
+    failed_fields_summary = {}
+    status_counts = Counter()
+    total = 0
+    
+    for table_name, table_results in results.items():
+        table_json = json_results[table_name] = []
+        append = table_json.append
+        table_failed_fields = defaultdict(list)
+        total += len(table_results)
+        
+        for result in table_results:
+            status = result['status']
+            status_counts[status] += 1
+            
+            append({
+                "field": result['field'],
+                "check_type": result['check_type'],
+                "status": status,
+                "message": result['message']
+            })
+            
+            if status in FAILED_STATUSES:
+                table_failed_fields[result['field']].append(result['check_type'])
+        
+        if table_failed_fields:
+            failed_fields_summary[table_name] = table_failed_fields
+    
+    summary_stats = {
+        "total_checks": total,
+        "passed_checks": status_counts['PASS'],
+        "failed_checks": status_counts['FAIL'],
+        "warnings": status_counts['WARNING'],
+        "tables_checked": len(results)
+    }
+    
+    return {
+        "success": True,
+        "message": "Data quality checks completed successfully",
+        "results": json_results,
+        "summary": summary_stats,
+        "failed_fields_summary": failed_fields_summary
+    }, 200
 
 @app.route('/', methods=['GET'])
 def home():
-    return jsonify({
+    return _json({
         "service": "Data Quality Checker API",
         "version": "1.0.0",
         "status": "running",
@@ -344,7 +639,7 @@ def home():
 
 @app.route('/health', methods=['GET'])
 def health_check():
-    return jsonify({
+    return _json({
         "status": "healthy",
         "timestamp": datetime.now().isoformat(),
         "service": "Data Quality Checker API"
@@ -352,157 +647,60 @@ def health_check():
 
 @app.route('/api/data-quality-check', methods=['POST'])
 def run_data_quality_checks():
+    # Reject oversized uploads from the declared length, before touching the body
+    content_length = request.content_length
+    if content_length is not None and content_length > MAX_CONTENT_LENGTH:
+        return _error('FILE_TOO_LARGE')
+    
     try:
+        # Parse uploaded files while the body is streamed in
+        try:
+            uploads = stream_uploads()
+        except ParseFailedException:
+            uploads = {}
+        
         # Check if files are present
-        if 'data_quality_file' not in request.files or 'system_codes_file' not in request.files:
-            return jsonify({
-                "success": False,
-                "error": "Both data_quality_file and system_codes_file are required",
-                "code": "MISSING_FILES"
-            }), 400
+        if 'data_quality_file' not in uploads or 'system_codes_file' not in uploads:
+            return _error('MISSING_FILES')
         
-        data_quality_file = request.files['data_quality_file']
-        system_codes_file = request.files['system_codes_file']
+        data_quality_file = uploads['data_quality_file']
+        system_codes_file = uploads['system_codes_file']
         
         # Validate files
-        if data_quality_file.filename == '' or system_codes_file.filename == '':
-            return jsonify({
-                "success": False,
-                "error": "Both files must have valid filenames",
-                "code": "EMPTY_FILENAMES"
-            }), 400
+        if data_quality_file.multipart_filename == '' or system_codes_file.multipart_filename == '':
+            return _error('EMPTY_FILENAMES')
         
-        if not (allowed_file(data_quality_file.filename) and allowed_file(system_codes_file.filename)):
-            return jsonify({
-                "success": False,
-                "error": "Only CSV files are allowed",
-                "code": "INVALID_FILE_TYPE"
-            }), 400
+        if not (allowed_file(data_quality_file.multipart_filename) and allowed_file(system_codes_file.multipart_filename)):
+            return _error('INVALID_FILE_TYPE')
         
-        # Create temporary directory for this request
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Save uploaded files
-            dq_filename = secure_filename(data_quality_file.filename)
-            sc_filename = secure_filename(system_codes_file.filename)
-            
-            dq_path = os.path.join(temp_dir, dq_filename)
-            sc_path = os.path.join(temp_dir, sc_filename)
-            db_path = os.path.join(temp_dir, 'temp_database.db')
-            
-            data_quality_file.save(dq_path)
-            system_codes_file.save(sc_path)
-            
-            # Create sample database for testing
-            if not create_sample_database(db_path):
-                return jsonify({
-                    "success": False,
-                    "error": "Failed to create sample database",
-                    "code": "DATABASE_ERROR"
-                }), 500
-            
-            # Initialize data quality checker
-            conn = sqlite3.connect(db_path)
-            checker = DataQualityChecker(conn)
-            
-            # Load configurations
-            if not checker.load_checks_config(dq_path):
-                conn.close()
-                return jsonify({
-                    "success": False,
-                    "error": "Failed to load data quality checks configuration",
-                    "code": "CONFIG_LOAD_ERROR"
-                }), 400
-            
-            if not checker.load_system_codes_config(sc_path):
-                conn.close()
-                return jsonify({
-                    "success": False,
-                    "error": "Failed to load system codes configuration", 
-                    "code": "SYSTEM_CODES_LOAD_ERROR"
-                }), 400
-            
-            # Run data quality checks
-            results = checker.run_all_checks()
-            conn.close()
-            
-            if not results:
-                return jsonify({
-                    "success": True,
-                    "message": "No data quality issues found",
-                    "results": {},
-                    "summary": {
-                        "total_checks": 0,
-                        "passed_checks": 0,
-                        "failed_checks": 0,
-                        "warnings": 0,
-                        "tables_checked": 0
-                    },
-                    "timestamp": datetime.now().isoformat()
-                })
-            
-            # Process results for JSON response
-            json_results = {}
-            summary_stats = {
-                "total_checks": 0,
-                "passed_checks": 0,
-                "failed_checks": 0,
-                "warnings": 0,
-                "tables_checked": len(results)
-            }
-            
-            for table_name, table_results in results.items():
-                json_results[table_name] = []
-                
-                for result in table_results:
-                    summary_stats["total_checks"] += 1
-                    
-                    if result['status'] == 'PASS':
-                        summary_stats["passed_checks"] += 1
-                    elif result['status'] == 'FAIL':
-                        summary_stats["failed_checks"] += 1
-                    elif result['status'] == 'WARNING':
-                        summary_stats["warnings"] += 1
-                    
-                    json_results[table_name].append({
-                        "field": result['field'],
-                        "check_type": result['check_type'],
-                        "status": result['status'],
-                        "message": result['message']
-                    })
-            
-            # Generate failed fields summary
-            failed_fields_summary = {}
-            for table_name, table_results in results.items():
-                table_failed_fields = {}
-                for result in table_results:
-                    if result['status'] in ['FAIL', 'ERROR']:
-                        field_name = result['field']
-                        if field_name not in table_failed_fields:
-                            table_failed_fields[field_name] = []
-                        table_failed_fields[field_name].append(result['check_type'])
-                
-                if table_failed_fields:
-                    failed_fields_summary[table_name] = table_failed_fields
-            
-            return jsonify({
-                "success": True,
-                "message": "Data quality checks completed successfully",
-                "results": json_results,
-                "summary": summary_stats,
-                "failed_fields_summary": failed_fields_summary,
-                "timestamp": datetime.now().isoformat()
-            })
+        dq_data = data_quality_file.value
+        sc_data = system_codes_file.value
+        
+        cache_key = (hashlib.sha256(dq_data).digest(), hashlib.sha256(sc_data).digest())
+        payload = results_cache.get(cache_key)
+        if payload is None:
+            payload, status = run_checks(dq_data, sc_data)
+            if status != 200:
+                return _json(payload, status)
+            results_cache.put(cache_key, payload)
+        
+        body = _stream_json({**payload, "timestamp": datetime.now().isoformat()})
+        if not _accepts_gzip():
+            return Response(body, mimetype='application/json')
+        
+        response = Response(_gzip_stream(body), mimetype='application/json')
+        response.headers['Content-Encoding'] = 'gzip'
+        return response
             
     except Exception as e:
-        logger.error(f"Error in data quality check endpoint: {str(e)}")
-        return jsonify({
+        logger.error("Error in data quality check endpoint: %s", e)
+        return _json({
             "success": False,
             "error": f"Internal server error: {str(e)}",
             "code": "INTERNAL_ERROR"
-        }), 500
+        }, 500)
 
-@app.route('/api/sample-configs', methods=['GET'])
-def get_sample_configs():
+def build_sample_configs():
     sample_data_quality = [
         {
             "table_name": "employees",
@@ -555,7 +753,7 @@ def get_sample_configs():
         }
     ]
     
-    return jsonify({
+    return {
         "success": True,
         "sample_configurations": {
             "data_quality_checks": {
@@ -574,32 +772,43 @@ def get_sample_configs():
                 "sample_data": sample_system_codes
             }
         }
-    })
+    }
+
+_SAMPLE_CONFIGS_BODY = orjson.dumps(build_sample_configs())
+_SAMPLE_CONFIGS_ETAG = hashlib.blake2b(_SAMPLE_CONFIGS_BODY).hexdigest()[:16]
+_SAMPLE_CONFIGS_GZIP = gzip.compress(_SAMPLE_CONFIGS_BODY, compresslevel=GZIP_LEVEL)
+
+@app.route('/api/sample-configs', methods=['GET'])
+def get_sample_configs():
+    if _accepts_gzip():
+        response = Response(_SAMPLE_CONFIGS_GZIP, mimetype='application/json')
+        response.headers['Content-Encoding'] = 'gzip'
+        response.set_etag(f"{_SAMPLE_CONFIGS_ETAG}-gzip")
+    else:
+        response = Response(_SAMPLE_CONFIGS_BODY, mimetype='application/json')
+        response.set_etag(_SAMPLE_CONFIGS_ETAG)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
 
 @app.errorhandler(413)
 def too_large(e):
-    return jsonify({
-        "success": False,
-        "error": "File too large. Maximum size is 16MB.",
-        "code": "FILE_TOO_LARGE"
-    }), 413
+    return _error('FILE_TOO_LARGE')
 
 @app.errorhandler(404)
 def not_found(e):
-    return jsonify({
-        "success": False,
-        "error": "Endpoint not found",
-        "code": "NOT_FOUND"
-    }), 404
+    return _error('NOT_FOUND')
 
 @app.errorhandler(500)
 def internal_error(e):
-    return jsonify({
-        "success": False,
-        "error": "Internal server error",
-        "code": "INTERNAL_ERROR"
-    }), 500
+    return _error('INTERNAL_ERROR')
+
+@app.after_request
+def set_cache_headers(response):
+    response.vary.add('Accept-Encoding')
+    if 'Cache-Control' not in response.headers:
+        response.headers['Cache-Control'] = 'no-store'
+    return response
 
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
-    app.run(host='0.0.0.0', port=port, debug=False)
+    app.run(host='0.0.0.0', port=port, debug=False, threaded=True)
@@ -0,0 +1,9 @@
+import multiprocessing
+import os
+
+# Checks are CPU-bound SQLite/CSV work, so use one worker process per core
+# and a handful of threads each to overlap upload I/O.
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+worker_class = 'gthread'
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+threads = int(os.environ.get('GUNICORN_THREADS', 8))
@@ -1,13 +1,17 @@
 import sqlite3
 import csv
 import re
-from typing import Dict, List, Optional
+import math
+import string
+from typing import Dict, Iterable, List, Optional
 from datetime import datetime
-import statistics
+from functools import lru_cache
+from collections import defaultdict
+from contextlib import contextmanager
 import os
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 import sys
-import json
 
 class Colors:
     HEADER = '\033[95m'
@@ -20,33 +24,93 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
 
+_ASCII_WORD_CHARS = frozenset(string.ascii_letters + string.digits + '_')
+
+def word_replacer(pairs):
+    """Build a function that swaps whole-word, case-insensitive names in one pass.
+
+    pairs is an ordered sequence of (name, replacement); the first pair wins
+    when names collide, as it would with one re.sub per pair.
+    """
+    pairs = [(name, replacement) for name, replacement in pairs if name]
+    if not pairs:
+        return lambda text: text
+    lookup = {}
+    for name, replacement in pairs:
+        lookup.setdefault(name.lower(), replacement)
+    alternation = '|'.join(re.escape(name) for name, _ in pairs)
+    pattern = re.compile(r'\b(?:' + alternation + r')\b', re.IGNORECASE)
+    # For ASCII text and names, matching the lowercased text case-sensitively finds the
+    # same spans as IGNORECASE (lower() keeps ASCII positions) without per-character folding
+    ascii_pattern = None
+    if alternation.isascii():
+        if all(name[0] in _ASCII_WORD_CHARS and name[-1] in _ASCII_WORD_CHARS for name, _ in pairs):
+            # Same boundaries as \b around word-character edges, but cheaper for SRE to reject
+            ascii_pattern = re.compile(r'(?<![A-Za-z0-9_])(?:' + alternation.lower() + r')(?![A-Za-z0-9_])')
+        else:
+            ascii_pattern = re.compile(r'\b(?:' + alternation.lower() + r')\b')
+
+    def replace(match):
+        text = match.group(0)
+        replacement = lookup.get(text.lower())
+        if replacement is None:
+            # Case-insensitive matches whose lower() differs from the name's (e.g. KELVIN SIGN)
+            replacement = next(r for name, r in pairs if re.fullmatch(re.escape(name), text, re.IGNORECASE))
+        return replacement
+
+    def substitute(text):
+        if ascii_pattern is None or not text.isascii():
+            return pattern.sub(replace, text)
+        parts = []
+        position = 0
+        for match in ascii_pattern.finditer(text.lower()):
+            parts.append(text[position:match.start()])
+            parts.append(lookup[match.group(0)])
+            position = match.end()
+        parts.append(text[position:])
+        return ''.join(parts)
+
+    return substitute
+
 class DataMaskingManager:
     def __init__(self):
         self.table_mapping = {}  # original_name -> masked_name
         self.column_mapping = {}  # table_name -> {original_col -> masked_col}
         self.reverse_table_mapping = {}  # masked_name -> original_name
         self.reverse_column_mapping = {}  # table_name -> {masked_col -> original_col}
+        self._mask_replacer = None  # built lazily, reset whenever a mapping is added
+        self._unmask_replacer = None
         
     def mask_table_name(self, original_name: str) -> str:
         """Convert original table name to masked version"""
-        if original_name not in self.table_mapping:
-            masked_name = f"table_{len(self.table_mapping) + 1}"
-            self.table_mapping[original_name] = masked_name
-            self.reverse_table_mapping[masked_name] = original_name
-        return self.table_mapping[original_name]
+        masked_name = self.table_mapping.get(original_name)
+        if masked_name is None:
+            masked_name = self._add_table_mapping(original_name)
+        return masked_name
+    
+    def _add_table_mapping(self, original_name: str) -> str:
+        masked_name = f"table_{len(self.table_mapping) + 1}"
+        self.table_mapping[original_name] = masked_name
+        self.reverse_table_mapping[masked_name] = original_name
+        self._mask_replacer = self._unmask_replacer = None
+        return masked_name
     
     def mask_column_name(self, table_name: str, original_col: str) -> str:
         """Convert original column name to masked version"""
-        if table_name not in self.column_mapping:
-            self.column_mapping[table_name] = {}
-            self.reverse_column_mapping[table_name] = {}
-        
-        if original_col not in self.column_mapping[table_name]:
-            masked_col = f"col_{len(self.column_mapping[table_name]) + 1}"
-            self.column_mapping[table_name][original_col] = masked_col
-            self.reverse_column_mapping[table_name][masked_col] = original_col
-        
-        return self.column_mapping[table_name][original_col]
+        columns = self.column_mapping.get(table_name)
+        if columns is not None:
+            masked_col = columns.get(original_col)
+            if masked_col is not None:
+                return masked_col
+        return self._add_column_mapping(table_name, original_col)
+    
+    def _add_column_mapping(self, table_name: str, original_col: str) -> str:
+        columns = self.column_mapping.setdefault(table_name, {})
+        masked_col = f"col_{len(columns) + 1}"
+        columns[original_col] = masked_col
+        self.reverse_column_mapping.setdefault(table_name, {})[masked_col] = original_col
+        self._mask_replacer = self._unmask_replacer = None
+        return masked_col
     
     def unmask_table_name(self, masked_name: str) -> str:
         """Convert masked table name back to original"""
@@ -58,114 +122,292 @@ class DataMaskingManager:
         if original_table in self.reverse_column_mapping:
             return self.reverse_column_mapping[original_table].get(masked_col, masked_col)
         return masked_col
+
+    def mask_user_query(self, user_query: str, schema_info: str) -> str:
+        """Mask table and column names in user query"""
+        if self._mask_replacer is None:
+            pairs = []
+            for original_table, masked_table in self.table_mapping.items():
+                pairs.append((original_table, masked_table))
+                pairs.extend(self.column_mapping.get(original_table, {}).items())
+            self._mask_replacer = word_replacer(pairs)
+        return self._mask_replacer(user_query)
+    
     def unmask_sql_query(self, masked_query: str) -> str:
         """Convert masked SQL query back to original names with better error handling"""
-        unmasked_query = masked_query
-        
         try:
-            # Unmask table names first
-            for masked_table, original_table in self.reverse_table_mapping.items():
-                pattern = r'\b' + re.escape(masked_table) + r'\b'
-                unmasked_query = re.sub(pattern, original_table, unmasked_query, flags=re.IGNORECASE)
-            
-            # Unmask column names - FIXED: iterate through all tables
-            for original_table, col_mapping in self.column_mapping.items():
-                for original_col, masked_col in col_mapping.items():
-                    # Use word boundary to avoid partial matches
-                    col_pattern = r'\b' + re.escape(masked_col) + r'\b'
-                    unmasked_query = re.sub(col_pattern, original_col, unmasked_query, flags=re.IGNORECASE)
-            
-            return unmasked_query
+            if self._unmask_replacer is None:
+                pairs = list(self.reverse_table_mapping.items())
+                for col_mapping in self.reverse_column_mapping.values():
+                    pairs.extend(col_mapping.items())
+                self._unmask_replacer = word_replacer(pairs)
+            return self._unmask_replacer(masked_query)
             
         except Exception as e:
             print(f"{Colors.WARNING}Warning: Error during unmasking: {str(e)}{Colors.ENDC}")
             print(f"{Colors.WARNING}Returning original masked query{Colors.ENDC}")
             return masked_query
-    def mask_user_query(self, user_query: str, schema_info: str) -> str:
-        """Mask table and column names in user query"""
-        masked_query = user_query
-        
-        # Extract table names from schema and mask them in query
-        for original_table in self.table_mapping.keys():
-            masked_table = self.table_mapping[original_table]
-            # Replace table names (case insensitive)
-            import re
-            pattern = r'\b' + re.escape(original_table) + r'\b'
-            masked_query = re.sub(pattern, masked_table, masked_query, flags=re.IGNORECASE)
-            
-            # Mask column names for this table
-            if original_table in self.column_mapping:
-                for original_col, masked_col in self.column_mapping[original_table].items():
-                    col_pattern = r'\b' + re.escape(original_col) + r'\b'
-                    masked_query = re.sub(col_pattern, masked_col, masked_query, flags=re.IGNORECASE)
-        
-        return masked_query
-    
-    def mask_schema_info(self, schema_info: str) -> str:
-        """Mask table and column names in schema information"""
-        masked_schema = schema_info
-        
-        for original_table in self.table_mapping.keys():
-            masked_table = self.table_mapping[original_table]
-            masked_schema = masked_schema.replace(f"Table: {original_table}", f"Table: {masked_table}")
-            
-            if original_table in self.column_mapping:
-                for original_col, masked_col in self.column_mapping[original_table].items():
-                    masked_schema = masked_schema.replace(original_col, masked_col)
-        
-        return masked_schema
-    
-    def unmask_sql_query(self, masked_query: str) -> str:
-        """Convert masked SQL query back to original names"""
-        unmasked_query = masked_query
-        
-        # Unmask table names
-        for masked_table, original_table in self.reverse_table_mapping.items():
-            import re
-            pattern = r'\b' + re.escape(masked_table) + r'\b'
-            unmasked_query = re.sub(pattern, original_table, unmasked_query, flags=re.IGNORECASE)
-        
-        # Unmask column names
-        for table_name, col_mapping in self.reverse_column_mapping.items():
-            for masked_col, original_col in col_mapping.items():
-                col_pattern = r'\b' + re.escape(masked_col) + r'\b'
-                unmasked_query = re.sub(col_pattern, original_col, unmasked_query, flags=re.IGNORECASE)
-        
-        return unmasked_query
+
+def quote_identifier(name: str) -> str:
+    """Quote a schema-validated table or column name for interpolation into SQL."""
+    return '"' + name.replace('"', '""') + '"'
+
+_PLAIN_NUMBER_RE = re.compile(r'[+-]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?')
+_NUMBER_HINT_RE = re.compile(r'[\dnN]')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_PHONE_CLEAN_RE = re.compile(r'[^\d+]')
+_PHONE_RE = re.compile(r'^\+?[1-9]\d{9,14}$')
+# Deletes the ASCII characters the special-characters check allows; Unicode whitespace is also allowed
+_ALLOWED_CHARACTERS_TABLE = str.maketrans('', '', string.ascii_letters + string.digits + string.whitespace + '.,@_-')
+SYSTEM_CODE_PATTERNS = (
+    r'^[A-F0-9]{8}-[A-F0-9]{4}-[A-F0-9]{4}-[A-F0-9]{4}-[A-F0-9]{12}$',
+    r'^[A-Z]{2,3}\d{3,}$',
+    r'^\d{6,}$',
+    r'^[A-Z0-9]{8,}$',
+)
+# One alternation matches all system-code shapes in a single pass
+_SYSTEM_CODE_RE = re.compile('|'.join(f"(?:{pattern})" for pattern in SYSTEM_CODE_PATTERNS))
+DATE_FORMATS = (
+    '%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%Y-%m-%d %H:%M:%S',
+    '%m-%d-%Y', '%d-%m-%Y', '%Y/%m/%d', '%d.%m.%Y',
+    '%Y', '%m/%Y', '%Y-%m'
+)
+# Field patterns used by datetime.strptime for each directive
+_STRPTIME_FIELDS = {
+    'Y': r'\d\d\d\d',
+    'm': r'1[0-2]|0[1-9]|[1-9]',
+    'd': r'3[01]|[12]\d|0[1-9]|[1-9]| [1-9]',
+    'H': r'2[0-3]|[0-1]\d|\d',
+    'M': r'[0-5]\d|\d',
+    'S': r'6[0-1]|[0-5]\d|\d',
+}
+
+def _compile_date_formats(formats):
+    """Fold strptime formats into one alternation; the first fully matching format wins."""
+    alternatives = []
+    for index, fmt in enumerate(formats):
+        pattern = []
+        for part in re.split(r'(%[YmdHMS])', fmt):
+            if part.startswith('%'):
+                pattern.append(f"(?P<{part[1]}{index}>{_STRPTIME_FIELDS[part[1]]})")
+            else:
+                pattern.append(r'\s+'.join(re.escape(chunk) for chunk in re.split(r'\s+', part)))
+        alternatives.append(f"(?:{''.join(pattern)})")
+    return re.compile('|'.join(alternatives))
+
+_DATE_RE = _compile_date_formats(DATE_FORMATS)
+
+# Validators are pure functions of the text and columns repeat values, so results are memoized
+@lru_cache(maxsize=8192)
+def _is_numeric_text(value: str) -> bool:
+    if _PLAIN_NUMBER_RE.fullmatch(value):
+        return True
+    # float() needs a digit, or the 'n' of inf/nan, to succeed
+    if not _NUMBER_HINT_RE.search(value):
+        return False
+    try:
+        float(value)
+        return True
+    except ValueError:
+        return False
+
+@lru_cache(maxsize=8192)
+def _is_valid_email_text(email: str) -> bool:
+    return _EMAIL_RE.match(email) is not None
+
+@lru_cache(maxsize=8192)
+def _is_valid_phone_text(phone: str) -> bool:
+    cleaned_phone = _PHONE_CLEAN_RE.sub('', phone)
+    if len(cleaned_phone) < 10 or len(cleaned_phone) > 15:
+        return False
+    return _PHONE_RE.match(cleaned_phone) is not None
+
+@lru_cache(maxsize=8192)
+def _is_valid_date_text(date_str: str) -> bool:
+    match = _DATE_RE.fullmatch(date_str)
+    if match is None:
+        return False
+    fields = {name[0]: int(value) for name, value in match.groupdict().items() if value is not None}
+    try:
+        datetime(fields['Y'], fields.get('m', 1), fields.get('d', 1),
+                 fields.get('H', 0), fields.get('M', 0), fields.get('S', 0))
+        return True
+    except ValueError:
+        return False
+
+@lru_cache(maxsize=8192)
+def _looks_like_system_code_text(code: str) -> bool:
+    return _SYSTEM_CODE_RE.match(code.upper()) is not None
+
+CHECK_FLAGS = (
+    'special_characters_check', 'null_check', 'blank_check', 'max_value_check',
+    'min_value_check', 'max_count_check', 'email_check', 'numeric_check',
+    'system_codes_check', 'language_check', 'phone_number_check', 'duplicate_check',
+    'date_check'
+)
+FAILED_STATUSES = frozenset({'FAIL', 'ERROR'})
+PASSED_STATUSES = frozenset({'PASS', 'INFO'})
+# Report CSVs are written through a 1 MiB buffer to keep write syscalls few
+CSV_BUFFER_SIZE = 1 << 20
+# Checks that count failing non-blank values with a validator registered on the connection
+VALUE_CHECK_FUNCTIONS = {
+    'email_check': 'dq_invalid_email',
+    'phone_number_check': 'dq_invalid_phone',
+    'date_check': 'dq_invalid_date',
+    'numeric_check': 'dq_non_numeric',
+    'special_characters_check': 'dq_special_characters',
+    'language_check': 'dq_non_ascii',
+}
+# Value checks whose failing values are exported; language_check reports a count only
+FAILING_VALUE_VALIDATORS = ('email_check', 'phone_number_check', 'date_check', 'numeric_check', 'special_characters_check')
+# Markdown code fences the model sometimes wraps around generated SQL
+_MD_FENCE_RE = re.compile(r'```(?:sql)?\n?')
+# Statements whose rows are printed rather than committed; matched without copying the query text
+_SELECT_RE = re.compile(r'\s*\(?\s*SELECT\b', re.IGNORECASE)
+# Connection-local tuning for the user's database; its journal mode is left as the user set it
+DATABASE_PRAGMAS = (
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+)
+# Prerequisites of the interactive menu options
+NEEDS_DB = 1
+NEEDS_API = 2
+
+class CheckResult:
+    """Outcome of one data quality check"""
+    __slots__ = ('table', 'field', 'check_type', 'status', 'message')
+
+    def __init__(self, table: str, field: str, check_type: str, status: str, message: str):
+        self.table = table
+        self.field = field
+        self.check_type = check_type
+        self.status = status
+        self.message = message
 
 class DataQualityChecker:
     def __init__(self, db_connection):
         self.db_connection = db_connection
         self.checks_config = {}
         self.system_codes_config = {}
+        self._system_code_sets = {}  # (table_name, field_name) -> uppercased valid codes
+        self._tables = None  # table names, loaded on first use
+        self._columns = {}  # table_name -> column names, loaded on first use
+        self._cwd = Path.cwd()  # report CSVs are written here
+        self._register_functions()
+
+    def _register_functions(self):
+        """Expose the per-value validators and converters to SQL; each sees the stripped text of a value."""
+        functions = {
+            # Validators return 1 for a failing value
+            'dq_invalid_email': lambda text: not self._is_valid_email(text),
+            'dq_invalid_phone': lambda text: not self._is_valid_phone(text),
+            'dq_invalid_date': lambda text: not self._is_valid_date(text),
+            'dq_non_numeric': lambda text: not self._is_numeric(text),
+            'dq_special_characters': self._has_special_characters,
+            'dq_non_ascii': self._has_non_ascii_characters,
+            'dq_invalid_system_code': lambda text: not self._looks_like_system_code(text),
+            # Uppercased code for comparison with the configured valid codes
+            'dq_system_code': str.upper,
+            # Converters split values into numbers and text for the min/max value checks
+            'dq_number': lambda text: float(text) if self._is_numeric(text) else None,
+            'dq_text': lambda text: None if self._is_numeric(text) else text,
+            'dq_lower': str.lower,
+        }
+        for name, function in functions.items():
+            self.db_connection.create_function(
+                name, 1, lambda value, function=function: function(str(value).strip()), deterministic=True
+            )
+
+    def _value_statistics(self, cursor, table: str, column: str, checks: Dict) -> Dict:
+        """Numeric and text summaries of a field's non-blank values for the min/max value checks."""
+        # INTEGER and REAL values are numbers without a Python call; only text needs the converters.
+        # LIMIT -1 keeps SQLite from flattening the subquery, so each converter runs once per row
+        stored_number = f"typeof({column}) IN ('integer', 'real')"
+        values = f"""
+            SELECT CASE WHEN {stored_number} THEN CAST({column} AS REAL) ELSE dq_number({column}) END AS number,
+                   CASE WHEN {stored_number} THEN NULL ELSE dq_text({column}) END AS text
+            FROM {table}
+            WHERE {column} IS NOT NULL AND {column} != ''
+            LIMIT -1
+        """
+        cursor.execute(f"""
+            SELECT COUNT(*), MIN(number), MAX(number), TOTAL(number), COUNT(number), COUNT(text), COUNT(DISTINCT text)
+            FROM ({values})
+        """)
+        value_count, min_numeric, max_numeric, numeric_total, finite_count, text_count, unique_text_count = cursor.fetchone()
+        numeric_count = value_count - text_count
+        if finite_count < numeric_count or numeric_total is None:
+            # SQLite returns NaN as NULL; a 'nan' value, or inf plus -inf, makes the average nan
+            avg_numeric = math.nan
+            if not finite_count:
+                min_numeric = max_numeric = math.nan
+        else:
+            avg_numeric = numeric_total / numeric_count if numeric_count else None
+        stats = {
+            'min_numeric': min_numeric,
+            'max_numeric': max_numeric,
+            'avg_numeric': avg_numeric,
+            'numeric_count': numeric_count,
+            'text_count': text_count,
+            'unique_text_count': unique_text_count,
+        }
+        
+        # Case-insensitive extremes; the bare text column comes from the first row holding the extreme
+        for check_type, key, aggregate in (('max_value_check', 'max_text', 'MAX'), ('min_value_check', 'min_text', 'MIN')):
+            stats[key] = None
+            if text_count and checks[check_type]:
+                cursor.execute(f"SELECT text, {aggregate}(dq_lower(text)) FROM ({values}) WHERE text IS NOT NULL")
+                stats[key] = cursor.fetchone()[0]
+        return stats
+
+    def _field_aggregates(self, field_name: str, checks: Dict) -> Dict[str, str]:
+        """SQL aggregates for every count the enabled checks on a field need, keyed by name."""
+        column = quote_identifier(field_name)
+        non_blank = f"{column} IS NOT NULL AND {column} != ''"
+        # SUM is NULL over no rows; IS '' stays 0/1 on NULL values where = '' would be NULL
+        aggregates = {
+            'total_rows': "COUNT(*)",
+            'null_count': f"COALESCE(SUM({column} IS NULL), 0)",
+            'blank_count': f"COALESCE(SUM({column} IS ''), 0)",
+            'non_null_count': f"COALESCE(SUM({non_blank}), 0)",
+        }
+        for check_type in VALUE_CHECK_FUNCTIONS:
+            if checks.get(check_type, False):
+                # CASE keeps the validator off NULL and blank values; AND does not short-circuit
+                failing = self._failing_value_condition(column, check_type)
+                aggregates[check_type] = f"COALESCE(SUM(CASE WHEN {non_blank} THEN {failing} ELSE 0 END), 0)"
+        return aggregates
+
+    def _failing_value_condition(self, column: str, check_type: str) -> str:
+        """SQL expression that is true for a non-blank value failing one of the VALUE_CHECK_FUNCTIONS checks."""
+        function_name = VALUE_CHECK_FUNCTIONS[check_type]
+        if check_type == 'numeric_check':
+            # INTEGER and REAL values are always numeric, so only text reaches the Python validator
+            return f"CASE WHEN typeof({column}) IN ('integer', 'real') THEN 0 ELSE {function_name}({column}) END"
+        return f"{function_name}({column})"
 
     def load_checks_config(self, csv_file_path: str) -> bool:
         try:
             with open(csv_file_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    table_name = row['table_name']
-                    field_name = row['field_name']
-                    
-                    if table_name not in self.checks_config:
-                        self.checks_config[table_name] = {}
-                    
-                    self.checks_config[table_name][field_name] = {
-                        'description': row['description'],
-                        'special_characters_check': row['special_characters_check'] == '1',
-                        'null_check': row['null_check'] == '1',
-                        'blank_check': row['blank_check'] == '1',
-                        'max_value_check': row['max_value_check'] == '1',
-                        'min_value_check': row['min_value_check'] == '1',
-                        'max_count_check': row['max_count_check'] == '1',
-                        'email_check': row['email_check'] == '1',
-                        'numeric_check': row['numeric_check'] == '1',
-                        'system_codes_check': row['system_codes_check'] == '1',
-                        'language_check': row['language_check'] == '1',
-                        'phone_number_check': row['phone_number_check'] == '1',
-                        'duplicate_check': row['duplicate_check'] == '1',
-                        'date_check': row['date_check'] == '1'
-                    }
+                reader = csv.reader(file)
+                header = next(reader, None)
+                rows = [row for row in reader if row]
+                
+                if rows:
+                    # Resolve column positions once; short rows read as None, like DictReader
+                    width = len(header)
+                    index = {name: position for position, name in enumerate(header)}
+                    table_i, field_i, description_i = index['table_name'], index['field_name'], index['description']
+                    flag_positions = [(flag, index[flag]) for flag in CHECK_FLAGS]
+                    for row in rows:
+                        if len(row) < width:
+                            row += [None] * (width - len(row))
+                        
+                        field_checks = {'description': row[description_i]}
+                        for flag, position in flag_positions:
+                            field_checks[flag] = row[position] == '1'
+                        self.checks_config.setdefault(row[table_i], {})[row[field_i]] = field_checks
             
             print(f"✓ Data quality checks configuration loaded successfully")
             print(f"Tables configured: {list(self.checks_config.keys())}")
@@ -174,368 +416,296 @@ class DataQualityChecker:
             print(f"Error loading checks configuration: {str(e)}")
             return False
 
-    def _run_field_checks(self, table_name: str, field_name: str, checks: Dict) -> List[Dict]:
+    def _run_field_checks(self, table_name: str, field_name: str, checks: Dict) -> List[CheckResult]:
         results = []
         
         if not self._column_exists(table_name, field_name):
-            results.append({
-                'table': table_name,
-                'field': field_name,
-                'check_type': 'column_existence',
-                'status': 'FAIL',
-                'message': f"Column '{field_name}' does not exist in table '{table_name}'"
-            })
+            results.append(CheckResult(
+                table=table_name,
+                field=field_name,
+                check_type='column_existence',
+                status='FAIL',
+                message=f"Column '{field_name}' does not exist in table '{table_name}'"
+            ))
             return results
 
         try:
             cursor = self.db_connection.cursor()
-            cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-            total_rows = cursor.fetchone()[0]
+            table, column = quote_identifier(table_name), quote_identifier(field_name)
+            aggregates = self._field_aggregates(field_name, checks)
+            cursor.execute(f"SELECT {', '.join(aggregates.values())} FROM {table}")
+            counts = dict(zip(aggregates, cursor.fetchone()))
+            total_rows = counts['total_rows']
+            non_null_count = counts['non_null_count']
 
             if total_rows == 0:
-                results.append({
-                    'table': table_name,
-                    'field': field_name,
-                    'check_type': 'data_existence',
-                    'status': 'WARNING',
-                    'message': f"Table '{table_name}' has no data"
-                })
+                results.append(CheckResult(
+                    table=table_name,
+                    field=field_name,
+                    check_type='data_existence',
+                    status='WARNING',
+                    message=f"Table '{table_name}' has no data"
+                ))
                 return results
 
             # Null check
             if checks.get('null_check', False):
-                cursor.execute(f"SELECT COUNT(*) FROM {table_name} WHERE {field_name} IS NULL")
-                null_count = cursor.fetchone()[0]
+                null_count = counts['null_count']
                 if null_count > 0:
-                    results.append({
-                        'table': table_name,
-                        'field': field_name,
-                        'check_type': 'null_check',
-                        'status': 'FAIL',
-                        'message': f"Found {null_count} NULL values out of {total_rows} total rows"
-                    })
+                    results.append(CheckResult(
+                        table=table_name,
+                        field=field_name,
+                        check_type='null_check',
+                        status='FAIL',
+                        message=f"Found {null_count} NULL values out of {total_rows} total rows"
+                    ))
                 else:
-                    results.append({
-                        'table': table_name,
-                        'field': field_name,
-                        'check_type': 'null_check',
-                        'status': 'PASS',
-                        'message': f"No NULL values found"
-                    })
+                    results.append(CheckResult(
+                        table=table_name,
+                        field=field_name,
+                        check_type='null_check',
+                        status='PASS',
+                        message=f"No NULL values found"
+                    ))
 
             # Blank check
             if checks.get('blank_check', False):
-                cursor.execute(f"SELECT COUNT(*) FROM {table_name} WHERE {field_name} = ''")
-                blank_count = cursor.fetchone()[0]
+                blank_count = counts['blank_count']
                 if blank_count > 0:
-                    results.append({
-                        'table': table_name,
-                        'field': field_name,
-                        'check_type': 'blank_check',
-                        'status': 'FAIL',
-                        'message': f"Found {blank_count} blank values out of {total_rows} total rows"
-                    })
+                    results.append(CheckResult(
+                        table=table_name,
+                        field=field_name,
+                        check_type='blank_check',
+                        status='FAIL',
+                        message=f"Found {blank_count} blank values out of {total_rows} total rows"
+                    ))
                 else:
-                    results.append({
-                        'table': table_name,
-                        'field': field_name,
-                        'check_type': 'blank_check',
-                        'status': 'PASS',
-                        'message': f"No blank values found"
-                    })
+                    results.append(CheckResult(
+                        table=table_name,
+                        field=field_name,
+                        check_type='blank_check',
+                        status='PASS',
+                        message=f"No blank values found"
+                    ))
 
             # Email check
             if checks.get('email_check', False):
-                cursor.execute(f"SELECT COUNT(*) FROM {table_name} WHERE {field_name} IS NOT NULL AND {field_name} != ''")
-                non_null_count = cursor.fetchone()[0]
-                
+                failing_count = counts['email_check']
                 if non_null_count > 0:
-                    cursor.execute(f"SELECT {field_name} FROM {table_name} WHERE {field_name} IS NOT NULL AND {field_name} != ''")
-                    values = cursor.fetchall()
-                    
-                    invalid_emails = []
-                    for value in values:
-                        email = str(value[0]).strip()
-                        if not self._is_valid_email(email):
-                            invalid_emails.append(email)
-                    
-                    if invalid_emails:
-                        results.append({
-                            'table': table_name,
-                            'field': field_name,
-                            'check_type': 'email_check',
-                            'status': 'FAIL',
-                            'message': f"Found {len(invalid_emails)} invalid email formats out of {non_null_count} values"
-                        })
+                    if failing_count:
+                        results.append(CheckResult(
+                            table=table_name,
+                            field=field_name,
+                            check_type='email_check',
+                            status='FAIL',
+                            message=f"Found {failing_count} invalid email formats out of {non_null_count} values"
+                        ))
                     else:
-                        results.append({
-                            'table': table_name,
-                            'field': field_name,
-                            'check_type': 'email_check',
-                            'status': 'PASS',
-                            'message': f"All {non_null_count} email formats appear valid"
-                        })
+                        results.append(CheckResult(
+                            table=table_name,
+                            field=field_name,
+                            check_type='email_check',
+                            status='PASS',
+                            message=f"All {non_null_count} email formats appear valid"
+                        ))
 
             # Phone number check
             if checks.get('phone_number_check', False):
-                cursor.execute(f"SELECT COUNT(*) FROM {table_name} WHERE {field_name} IS NOT NULL AND {field_name} != ''")
-                non_null_count = cursor.fetchone()[0]
-                
+                failing_count = counts['phone_number_check']
                 if non_null_count > 0:
-                    cursor.execute(f"SELECT {field_name} FROM {table_name} WHERE {field_name} IS NOT NULL AND {field_name} != ''")
-                    values = cursor.fetchall()
-                    
-                    invalid_phones = []
-                    for value in values:
-                        phone = str(value[0]).strip()
-                        if not self._is_valid_phone(phone):
-                            invalid_phones.append(phone)
-                    
-                    if invalid_phones:
-                        results.append({
-                            'table': table_name,
-                            'field': field_name,
-                            'check_type': 'phone_number_check',
-                            'status': 'FAIL',
-                            'message': f"Found {len(invalid_phones)} invalid phone numbers out of {non_null_count} values"
-                        })
+                    if failing_count:
+                        results.append(CheckResult(
+                            table=table_name,
+                            field=field_name,
+                            check_type='phone_number_check',
+                            status='FAIL',
+                            message=f"Found {failing_count} invalid phone numbers out of {non_null_count} values"
+                        ))
                     else:
-                        results.append({
-                            'table': table_name,
-                            'field': field_name,
-                            'check_type': 'phone_number_check',
-                            'status': 'PASS',
-                            'message': f"All {non_null_count} phone numbers appear valid"
-                        })
+                        results.append(CheckResult(
+                            table=table_name,
+                            field=field_name,
+                            check_type='phone_number_check',
+                            status='PASS',
+                            message=f"All {non_null_count} phone numbers appear valid"
+                        ))
 
             # Date check
             if checks.get('date_check', False):
-                cursor.execute(f"SELECT COUNT(*) FROM {table_name} WHERE {field_name} IS NOT NULL AND {field_name} != ''")
-                non_null_count = cursor.fetchone()[0]
-                
+                failing_count = counts['date_check']
                 if non_null_count > 0:
-                    cursor.execute(f"SELECT {field_name} FROM {table_name} WHERE {field_name} IS NOT NULL AND {field_name} != ''")
-                    values = cursor.fetchall()
-                    
-                    invalid_dates = []
-                    for value in values:
-                        date_str = str(value[0]).strip()
-                        if not self._is_valid_date(date_str):
-                            invalid_dates.append(date_str)
-                    
-                    if invalid_dates:
-                        results.append({
-                            'table': table_name,
-                            'field': field_name,
-                            'check_type': 'date_check',
-                            'status': 'FAIL',
-                            'message': f"Found {len(invalid_dates)} invalid date formats out of {non_null_count} values"
-                        })
+                    if failing_count:
+                        results.append(CheckResult(
+                            table=table_name,
+                            field=field_name,
+                            check_type='date_check',
+                            status='FAIL',
+                            message=f"Found {failing_count} invalid date formats out of {non_null_count} values"
+                        ))
                     else:
-                        results.append({
-                            'table': table_name,
-                            'field': field_name,
-                            'check_type': 'date_check',
-                            'status': 'PASS',
-                            'message': f"All {non_null_count} date formats appear valid"
-                        })
+                        results.append(CheckResult(
+                            table=table_name,
+                            field=field_name,
+                            check_type='date_check',
+                            status='PASS',
+                            message=f"All {non_null_count} date formats appear valid"
+                        ))
 
             # Numeric check
             if checks.get('numeric_check', False):
-                cursor.execute(f"SELECT COUNT(*) FROM {table_name} WHERE {field_name} IS NOT NULL AND {field_name} != ''")
-                non_null_count = cursor.fetchone()[0]
-                
+                failing_count = counts['numeric_check']
                 if non_null_count > 0:
-                    cursor.execute(f"SELECT {field_name} FROM {table_name} WHERE {field_name} IS NOT NULL AND {field_name} != ''")
-                    values = cursor.fetchall()
-                    
-                    non_numeric_values = []
-                    for value in values:
-                        val_str = str(value[0]).strip()
-                        if not self._is_numeric(val_str):
-                            non_numeric_values.append(val_str)
-                    
-                    if non_numeric_values:
-                        results.append({
-                            'table': table_name,
-                            'field': field_name,
-                            'check_type': 'numeric_check',
-                            'status': 'FAIL',
-                            'message': f"Found {len(non_numeric_values)} non-numeric values out of {non_null_count} non-null values"
-                        })
+                    if failing_count:
+                        results.append(CheckResult(
+                            table=table_name,
+                            field=field_name,
+                            check_type='numeric_check',
+                            status='FAIL',
+                            message=f"Found {failing_count} non-numeric values out of {non_null_count} non-null values"
+                        ))
                     else:
-                        results.append({
-                            'table': table_name,
-                            'field': field_name,
-                            'check_type': 'numeric_check',
-                            'status': 'PASS',
-                            'message': f"All {non_null_count} values are numeric"
-                        })
-
-            # Duplicate check
+                        results.append(CheckResult(
+                            table=table_name,
+                            field=field_name,
+                            check_type='numeric_check',
+                            status='PASS',
+                            message=f"All {non_null_count} values are numeric"
+                        ))
+
+            # Duplicate check; the duplicated groups are counted inside SQLite rather than fetched
             if checks.get('duplicate_check', False):
                 cursor.execute(f"""
-                    SELECT {field_name}, COUNT(*) as count
-                    FROM {table_name}
-                    WHERE {field_name} IS NOT NULL
-                    GROUP BY {field_name}
-                    HAVING COUNT(*) > 1
-                    ORDER BY count DESC
+                    SELECT COUNT(*), COALESCE(SUM(count - 1), 0)
+                    FROM (
+                        SELECT COUNT(*) AS count
+                        FROM {table}
+                        WHERE {column} IS NOT NULL
+                        GROUP BY {column}
+                        HAVING COUNT(*) > 1
+                    )
                 """)
-                duplicates = cursor.fetchall()
+                duplicate_groups, total_duplicate_count = cursor.fetchone()
                 
-                if duplicates:
-                    total_duplicate_count = sum(count - 1 for _, count in duplicates)
-                    results.append({
-                        'table': table_name,
-                        'field': field_name,
-                        'check_type': 'duplicate_check',
-                        'status': 'FAIL',
-                        'message': f"Found {total_duplicate_count} duplicate values across {len(duplicates)} distinct values"
-                    })
+                if duplicate_groups:
+                    results.append(CheckResult(
+                        table=table_name,
+                        field=field_name,
+                        check_type='duplicate_check',
+                        status='FAIL',
+                        message=f"Found {total_duplicate_count} duplicate values across {duplicate_groups} distinct values"
+                    ))
                 else:
-                    results.append({
-                        'table': table_name,
-                        'field': field_name,
-                        'check_type': 'duplicate_check',
-                        'status': 'PASS',
-                        'message': f"No duplicate values found"
-                    })
+                    results.append(CheckResult(
+                        table=table_name,
+                        field=field_name,
+                        check_type='duplicate_check',
+                        status='PASS',
+                        message=f"No duplicate values found"
+                    ))
 
             # Special characters check
             if checks.get('special_characters_check', False):
-                cursor.execute(f"SELECT COUNT(*) FROM {table_name} WHERE {field_name} IS NOT NULL AND {field_name} != ''")
-                non_null_count = cursor.fetchone()[0]
-                
+                failing_count = counts['special_characters_check']
                 if non_null_count > 0:
-                    cursor.execute(f"SELECT {field_name} FROM {table_name} WHERE {field_name} IS NOT NULL AND {field_name} != ''")
-                    values = cursor.fetchall()
-                    
-                    special_char_values = []
-                    for value in values:
-                        text = str(value[0]).strip()
-                        if self._has_special_characters(text):
-                            special_char_values.append(text)
-                    
-                    if special_char_values:
-                        results.append({
-                            'table': table_name,
-                            'field': field_name,
-                            'check_type': 'special_characters_check',
-                            'status': 'FAIL',
-                            'message': f"Found {len(special_char_values)} values with special characters out of {non_null_count} values"
-                        })
+                    if failing_count:
+                        results.append(CheckResult(
+                            table=table_name,
+                            field=field_name,
+                            check_type='special_characters_check',
+                            status='FAIL',
+                            message=f"Found {failing_count} values with special characters out of {non_null_count} values"
+                        ))
                     else:
-                        results.append({
-                            'table': table_name,
-                            'field': field_name,
-                            'check_type': 'special_characters_check',
-                            'status': 'PASS',
-                            'message': f"No special characters found"
-                        })
+                        results.append(CheckResult(
+                            table=table_name,
+                            field=field_name,
+                            check_type='special_characters_check',
+                            status='PASS',
+                            message=f"No special characters found"
+                        ))
 
             if checks.get('system_codes_check', False):
-                cursor.execute(f"SELECT COUNT(*) FROM {table_name} WHERE {field_name} IS NOT NULL AND {field_name} != ''")
-                non_null_count = cursor.fetchone()[0]
-                
                 if non_null_count > 0:
-                    cursor.execute(f"SELECT DISTINCT {field_name} FROM {table_name} WHERE {field_name} IS NOT NULL AND {field_name} != ''")
-                    values = cursor.fetchall()
-                    
                     # Get predefined valid codes for this table/field
                     valid_codes_list = self._get_valid_system_codes(table_name, field_name)
-                    invalid_system_codes = []
+                    invalid_code, parameters = self._invalid_system_code_condition(table_name, field_name, column)
                     
-                    for value in values:
-                        code = str(value[0]).strip().upper()
-                        # Convert valid codes to uppercase for comparison
-                        valid_codes_upper = [vc.upper() for vc in valid_codes_list] if valid_codes_list else []
-                        
-                        if valid_codes_list and code not in valid_codes_upper:
-                            invalid_system_codes.append(str(value[0]).strip())  # Keep original case for display
-                        elif not valid_codes_list and not self._looks_like_system_code(code):
-                            invalid_system_codes.append(str(value[0]).strip())
+                    # Distinct stored values that fail, counted in SQL
+                    cursor.execute(f"""
+                        SELECT COUNT(DISTINCT {column}) FROM {table}
+                        WHERE {column} IS NOT NULL AND {column} != '' AND {invalid_code}
+                    """, parameters)
+                    invalid_code_count = cursor.fetchone()[0]
                     
-                    if invalid_system_codes:
+                    if invalid_code_count:
                         if valid_codes_list:
-                            message = f"Found {len(invalid_system_codes)} invalid system codes out of {non_null_count} values"
+                            message = f"Found {invalid_code_count} invalid system codes out of {non_null_count} values"
                             message += f" (Valid codes: {len(valid_codes_list)} defined)"
                         else:
-                            message = f"Found {len(invalid_system_codes)} values that don't match system code patterns out of {non_null_count} values"
+                            message = f"Found {invalid_code_count} values that don't match system code patterns out of {non_null_count} values"
                         
-                        results.append({
-                            'table': table_name,
-                            'field': field_name,
-                            'check_type': 'system_codes_check',
-                            'status': 'FAIL',
-                            'message': message
-                        })
+                        results.append(CheckResult(
+                            table=table_name,
+                            field=field_name,
+                            check_type='system_codes_check',
+                            status='FAIL',
+                            message=message
+                        ))
                     else:
                         if valid_codes_list:
-                            results.append({
-                                'table': table_name,
-                                'field': field_name,
-                                'check_type': 'system_codes_check',
-                                'status': 'PASS',
-                                'message': f"All {non_null_count} values are valid system codes from external config ({len(valid_codes_list)} codes)"
-                            })
+                            results.append(CheckResult(
+                                table=table_name,
+                                field=field_name,
+                                check_type='system_codes_check',
+                                status='PASS',
+                                message=f"All {non_null_count} values are valid system codes from external config ({len(valid_codes_list)} codes)"
+                            ))
                         else:
-                            results.append({
-                                'table': table_name,
-                                'field': field_name,
-                                'check_type': 'system_codes_check',
-                                'status': 'PASS',
-                                'message': f"All {non_null_count} values match system code patterns"
-                            })
+                            results.append(CheckResult(
+                                table=table_name,
+                                field=field_name,
+                                check_type='system_codes_check',
+                                status='PASS',
+                                message=f"All {non_null_count} values match system code patterns"
+                            ))
                 else:
-                    results.append({
-                        'table': table_name,
-                        'field': field_name,
-                        'check_type': 'system_codes_check',
-                        'status': 'WARNING',
-                        'message': f"No data found to check system codes"
-                    })
+                    results.append(CheckResult(
+                        table=table_name,
+                        field=field_name,
+                        check_type='system_codes_check',
+                        status='WARNING',
+                        message=f"No data found to check system codes"
+                    ))
 
 
             # Language check (non-ASCII characters)
             if checks.get('language_check', False):
-                cursor.execute(f"SELECT COUNT(*) FROM {table_name} WHERE {field_name} IS NOT NULL AND {field_name} != ''")
-                non_null_count = cursor.fetchone()[0]
-                
+                failing_count = counts['language_check']
                 if non_null_count > 0:
-                    cursor.execute(f"SELECT {field_name} FROM {table_name} WHERE {field_name} IS NOT NULL AND {field_name} != ''")
-                    values = cursor.fetchall()
-                    
-                    non_ascii_values = []
-                    for value in values:
-                        text = str(value[0]).strip()
-                        if self._has_non_ascii_characters(text):
-                            non_ascii_values.append(text)
-                    
-                    if non_ascii_values:
-                        results.append({
-                            'table': table_name,
-                            'field': field_name,
-                            'check_type': 'language_check',
-                            'status': 'FAIL',
-                            'message': f"Found {len(non_ascii_values)} values with non-ASCII characters out of {non_null_count} values"
-                        })
+                    if failing_count:
+                        results.append(CheckResult(
+                            table=table_name,
+                            field=field_name,
+                            check_type='language_check',
+                            status='FAIL',
+                            message=f"Found {failing_count} values with non-ASCII characters out of {non_null_count} values"
+                        ))
                     else:
-                        results.append({
-                            'table': table_name,
-                            'field': field_name,
-                            'check_type': 'language_check',
-                            'status': 'PASS',
-                            'message': f"All {non_null_count} values contain only ASCII characters"
-                        })
+                        results.append(CheckResult(
+                            table=table_name,
+                            field=field_name,
+                            check_type='language_check',
+                            status='PASS',
+                            message=f"All {non_null_count} values contain only ASCII characters"
+                        ))
 
             # Max count check
             if checks.get('max_count_check', False):
                 cursor.execute(f"""
-                    SELECT {field_name}, COUNT(*) as count
-                    FROM {table_name}
-                    WHERE {field_name} IS NOT NULL AND {field_name} != ''
-                    GROUP BY {field_name}
+                    SELECT {column}, COUNT(*) as count
+                    FROM {table}
+                    WHERE {column} IS NOT NULL AND {column} != ''
+                    GROUP BY {column}
                     ORDER BY count DESC
                     LIMIT 1
                 """)
@@ -543,181 +713,150 @@ class DataQualityChecker:
                 
                 if max_count_result:
                     max_value, max_count = max_count_result
-                    results.append({
-                        'table': table_name,
-                        'field': field_name,
-                        'check_type': 'max_count_check',
-                        'status': 'INFO',
-                        'message': f"Most frequent value: '{max_value}' appears {max_count} times"
-                    })
+                    results.append(CheckResult(
+                        table=table_name,
+                        field=field_name,
+                        check_type='max_count_check',
+                        status='INFO',
+                        message=f"Most frequent value: '{max_value}' appears {max_count} times"
+                    ))
+
+                if (checks['max_value_check'] or checks['min_value_check']) and non_null_count > 0:
+                    value_stats = self._value_statistics(cursor, table, column, checks)
 
                 if checks['max_value_check']:
-                                cursor.execute(f"SELECT COUNT(*) FROM {table_name} WHERE {field_name} IS NOT NULL AND {field_name} != ''")
-                                non_null_count = cursor.fetchone()[0]
-                                
                                 if non_null_count > 0:
-                                    cursor.execute(f"""
-                                        SELECT {field_name} FROM {table_name} 
-                                        WHERE {field_name} IS NOT NULL AND {field_name} != ''
-                                    """)
-                                    values = cursor.fetchall()
-                                    
-                                    numeric_values = []
-                                    text_values = []
-                                    
-                                    # Separate numeric and text values
-                                    for value in values:
-                                        val_str = str(value[0]).strip()
-                                        if self._is_numeric(val_str):
-                                            numeric_values.append(float(val_str))
-                                        else:
-                                            text_values.append(val_str)
+                                    numeric_count = value_stats['numeric_count']
+                                    text_count = value_stats['text_count']
                                     
                                     # Handle numeric values
-                                    if numeric_values:
-                                        max_numeric = max(numeric_values)
-                                        avg_numeric = sum(numeric_values) / len(numeric_values)
+                                    if numeric_count:
+                                        max_numeric = value_stats['max_numeric']
+                                        avg_numeric = value_stats['avg_numeric']
                                         
                                         if max_numeric > avg_numeric * 10:
-                                            results.append({
-                                                'table': table_name,
-                                                'field': field_name,
-                                                'check_type': 'max_value_check',
-                                                'status': 'WARNING',
-                                                'message': f"Max numeric value {max_numeric} is significantly higher than average {avg_numeric:.2f} (potential outlier)"
-                                            })
+                                            results.append(CheckResult(
+                                                table=table_name,
+                                                field=field_name,
+                                                check_type='max_value_check',
+                                                status='WARNING',
+                                                message=f"Max numeric value {max_numeric} is significantly higher than average {avg_numeric:.2f} (potential outlier)"
+                                            ))
                                         else:
-                                            results.append({
-                                                'table': table_name,
-                                                'field': field_name,
-                                                'check_type': 'max_value_check',
-                                                'status': 'PASS',
-                                                'message': f"Max numeric value {max_numeric} appears reasonable (avg: {avg_numeric:.2f})"
-                                            })
+                                            results.append(CheckResult(
+                                                table=table_name,
+                                                field=field_name,
+                                                check_type='max_value_check',
+                                                status='PASS',
+                                                message=f"Max numeric value {max_numeric} appears reasonable (avg: {avg_numeric:.2f})"
+                                            ))
                                     
                                     # Handle text values - find alphabetically last value
-                                    if text_values:
-                                        max_text = max(text_values, key=str.lower)  # Case-insensitive sorting
-                                        unique_text_count = len(set(text_values))
+                                    if text_count:
+                                        max_text = value_stats['max_text']  # Case-insensitive sorting
+                                        unique_text_count = value_stats['unique_text_count']
                                         
-                                        results.append({
-                                            'table': table_name,
-                                            'field': field_name,
-                                            'check_type': 'max_value_check',
-                                            'status': 'INFO',
-                                            'message': f"Alphabetically last text value: '{max_text}' (found {len(text_values)} text values, {unique_text_count} unique)"
-                                        })
+                                        results.append(CheckResult(
+                                            table=table_name,
+                                            field=field_name,
+                                            check_type='max_value_check',
+                                            status='INFO',
+                                            message=f"Alphabetically last text value: '{max_text}' (found {text_count} text values, {unique_text_count} unique)"
+                                        ))
                                     
                                     # Summary message
-                                    if numeric_values and text_values:
-                                        results.append({
-                                            'table': table_name,
-                                            'field': field_name,
-                                            'check_type': 'max_value_check',
-                                            'status': 'INFO',
-                                            'message': f"Field contains mixed data types: {len(numeric_values)} numeric, {len(text_values)} text values"
-                                        })
-                                    elif not numeric_values and not text_values:
-                                        results.append({
-                                            'table': table_name,
-                                            'field': field_name,
-                                            'check_type': 'max_value_check',
-                                            'status': 'WARNING',
-                                            'message': f"No valid values found for max value analysis"
-                                        })
+                                    if numeric_count and text_count:
+                                        results.append(CheckResult(
+                                            table=table_name,
+                                            field=field_name,
+                                            check_type='max_value_check',
+                                            status='INFO',
+                                            message=f"Field contains mixed data types: {numeric_count} numeric, {text_count} text values"
+                                        ))
+                                    elif not numeric_count and not text_count:
+                                        results.append(CheckResult(
+                                            table=table_name,
+                                            field=field_name,
+                                            check_type='max_value_check',
+                                            status='WARNING',
+                                            message=f"No valid values found for max value analysis"
+                                        ))
                             
                 if checks['min_value_check']:
-                                cursor.execute(f"SELECT COUNT(*) FROM {table_name} WHERE {field_name} IS NOT NULL AND {field_name} != ''")
-                                non_null_count = cursor.fetchone()[0]
-                                
                                 if non_null_count > 0:
-                                    cursor.execute(f"""
-                                        SELECT {field_name} FROM {table_name} 
-                                        WHERE {field_name} IS NOT NULL AND {field_name} != ''
-                                    """)
-                                    values = cursor.fetchall()
-                                    
-                                    numeric_values = []
-                                    text_values = []
-                                    
-                                    # Separate numeric and text values
-                                    for value in values:
-                                        val_str = str(value[0]).strip()
-                                        if self._is_numeric(val_str):
-                                            numeric_values.append(float(val_str))
-                                        else:
-                                            text_values.append(val_str)
+                                    numeric_count = value_stats['numeric_count']
+                                    text_count = value_stats['text_count']
                                     
                                     # Handle numeric values
-                                    if numeric_values:
-                                        min_numeric = min(numeric_values)
-                                        avg_numeric = sum(numeric_values) / len(numeric_values)
+                                    if numeric_count:
+                                        min_numeric = value_stats['min_numeric']
+                                        avg_numeric = value_stats['avg_numeric']
                                         
                                         if min_numeric < 0:
-                                            results.append({
-                                                'table': table_name,
-                                                'field': field_name,
-                                                'check_type': 'min_value_check',
-                                                'status': 'WARNING',
-                                                'message': f"Found negative minimum value: {min_numeric}"
-                                            })
+                                            results.append(CheckResult(
+                                                table=table_name,
+                                                field=field_name,
+                                                check_type='min_value_check',
+                                                status='WARNING',
+                                                message=f"Found negative minimum value: {min_numeric}"
+                                            ))
                                         elif min_numeric < avg_numeric * 0.1 and avg_numeric > 0:
-                                            results.append({
-                                                'table': table_name,
-                                                'field': field_name,
-                                                'check_type': 'min_value_check',
-                                                'status': 'WARNING',
-                                                'message': f"Min numeric value {min_numeric} is significantly lower than average {avg_numeric:.2f} (potential outlier)"
-                                            })
+                                            results.append(CheckResult(
+                                                table=table_name,
+                                                field=field_name,
+                                                check_type='min_value_check',
+                                                status='WARNING',
+                                                message=f"Min numeric value {min_numeric} is significantly lower than average {avg_numeric:.2f} (potential outlier)"
+                                            ))
                                         else:
-                                            results.append({
-                                                'table': table_name,
-                                                'field': field_name,
-                                                'check_type': 'min_value_check',
-                                                'status': 'PASS',
-                                                'message': f"Min numeric value {min_numeric} appears reasonable (avg: {avg_numeric:.2f})"
-                                            })
+                                            results.append(CheckResult(
+                                                table=table_name,
+                                                field=field_name,
+                                                check_type='min_value_check',
+                                                status='PASS',
+                                                message=f"Min numeric value {min_numeric} appears reasonable (avg: {avg_numeric:.2f})"
+                                            ))
                                     
                                     # Handle text values - find alphabetically first value
-                                    if text_values:
-                                        min_text = min(text_values, key=str.lower)  # Case-insensitive sorting
-                                        unique_text_count = len(set(text_values))
+                                    if text_count:
+                                        min_text = value_stats['min_text']  # Case-insensitive sorting
+                                        unique_text_count = value_stats['unique_text_count']
                                         
-                                        results.append({
-                                            'table': table_name,
-                                            'field': field_name,
-                                            'check_type': 'min_value_check',
-                                            'status': 'INFO',
-                                            'message': f"Alphabetically first text value: '{min_text}' (found {len(text_values)} text values, {unique_text_count} unique)"
-                                        })
+                                        results.append(CheckResult(
+                                            table=table_name,
+                                            field=field_name,
+                                            check_type='min_value_check',
+                                            status='INFO',
+                                            message=f"Alphabetically first text value: '{min_text}' (found {text_count} text values, {unique_text_count} unique)"
+                                        ))
                                     
                                     # Summary message
-                                    if numeric_values and text_values:
-                                        results.append({
-                                            'table': table_name,
-                                            'field': field_name,
-                                            'check_type': 'min_value_check',
-                                            'status': 'INFO',
-                                            'message': f"Field contains mixed data types: {len(numeric_values)} numeric, {len(text_values)} text values"
-                                        })
-                                    elif not numeric_values and not text_values:
-                                        results.append({
-                                            'table': table_name,
-                                            'field': field_name,
-                                            'check_type': 'min_value_check',
-                                            'status': 'WARNING',
-                                            'message': f"No valid values found for min value analysis"
-                                        })
+                                    if numeric_count and text_count:
+                                        results.append(CheckResult(
+                                            table=table_name,
+                                            field=field_name,
+                                            check_type='min_value_check',
+                                            status='INFO',
+                                            message=f"Field contains mixed data types: {numeric_count} numeric, {text_count} text values"
+                                        ))
+                                    elif not numeric_count and not text_count:
+                                        results.append(CheckResult(
+                                            table=table_name,
+                                            field=field_name,
+                                            check_type='min_value_check',
+                                            status='WARNING',
+                                            message=f"No valid values found for min value analysis"
+                                        ))
 
 
         except sqlite3.Error as e:
-            results.append({
-                'table': table_name,
-                'field': field_name,
-                'check_type': 'database_error',
-                'status': 'ERROR',
-                'message': f"Database error: {str(e)}"
-            })
+            results.append(CheckResult(
+                table=table_name,
+                field=field_name,
+                check_type='database_error',
+                status='ERROR',
+                message=f"Database error: {str(e)}"
+            ))
 
         return results
 
@@ -725,21 +864,25 @@ class DataQualityChecker:
         """Load system codes configuration from CSV file"""
         try:
             self.system_codes_config = {}
+            self._system_code_sets = {}
             
             with open(csv_file_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    table_name = row['table_name']
-                    field_name = row['field_name']
-                    valid_codes_str = row['valid_codes']
-                    
-                    # Parse comma-separated codes
-                    valid_codes = [code.strip() for code in valid_codes_str.split(',') if code.strip()]
-                    
-                    if table_name not in self.system_codes_config:
-                        self.system_codes_config[table_name] = {}
-                    
-                    self.system_codes_config[table_name][field_name] = valid_codes
+                reader = csv.reader(file)
+                header = next(reader, None)
+                rows = [row for row in reader if row]
+                
+                if rows:
+                    # Resolve column positions once; short rows read as None, like DictReader
+                    width = len(header)
+                    index = {name: position for position, name in enumerate(header)}
+                    table_i, field_i, codes_i = index['table_name'], index['field_name'], index['valid_codes']
+                    for row in rows:
+                        if len(row) < width:
+                            row += [None] * (width - len(row))
+                        
+                        # Parse comma-separated codes
+                        valid_codes = [code.strip() for code in row[codes_i].split(',') if code.strip()]
+                        self.system_codes_config.setdefault(row[table_i], {})[row[field_i]] = valid_codes
             
             print(f"✓ System codes configuration loaded successfully")
             print(f"Tables with system codes: {list(self.system_codes_config.keys())}")
@@ -756,83 +899,77 @@ class DataQualityChecker:
 
 
     def _table_exists(self, table_name: str) -> bool:
-        try:
-            cursor = self.db_connection.cursor()
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name=?", (table_name,))
-            return cursor.fetchone() is not None
-        except sqlite3.Error:
-            return False
+        if self._tables is None:
+            try:
+                cursor = self.db_connection.cursor()
+                cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+                self._tables = frozenset(row[0] for row in cursor)
+            except sqlite3.Error:
+                return False
+        return table_name in self._tables
 
     def _column_exists(self, table_name: str, column_name: str) -> bool:
-        try:
-            cursor = self.db_connection.cursor()
-            cursor.execute(f"PRAGMA table_info({table_name})")
-            columns = [row[1] for row in cursor.fetchall()]
-            return column_name in columns
-        except sqlite3.Error:
-            return False
+        columns = self._columns.get(table_name)
+        if columns is None:
+            try:
+                cursor = self.db_connection.cursor()
+                cursor.execute(f"PRAGMA table_info({quote_identifier(table_name)})")
+                columns = frozenset(row[1] for row in cursor.fetchall())
+            except sqlite3.Error:
+                return False
+            self._columns[table_name] = columns
+        return column_name in columns
+
+    def invalidate_schema_cache(self):
+        """Forget cached table and column names after the database schema may have changed"""
+        self._tables = None
+        self._columns.clear()
 
     def _is_numeric(self, value: str) -> bool:
-        try:
-            float(value)
-            return True
-        except ValueError:
-            return False
+        return _is_numeric_text(value)
 
     def _is_valid_email(self, email: str) -> bool:
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(email_pattern, email) is not None
+        return _is_valid_email_text(email)
 
     def _is_valid_phone(self, phone: str) -> bool:
-        cleaned_phone = re.sub(r'[^\d+]', '', phone)
-        if len(cleaned_phone) < 10 or len(cleaned_phone) > 15:
-            return False
-        phone_pattern = r'^\+?[1-9]\d{9,14}$'
-        return re.match(phone_pattern, cleaned_phone) is not None
+        return _is_valid_phone_text(phone)
 
     def _is_valid_date(self, date_str: str) -> bool:
-        date_formats = [
-            '%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%Y-%m-%d %H:%M:%S',
-            '%m-%d-%Y', '%d-%m-%Y', '%Y/%m/%d', '%d.%m.%Y',
-            '%Y', '%m/%Y', '%Y-%m'
-        ]
-        
-        for fmt in date_formats:
-            try:
-                datetime.strptime(str(date_str), fmt)
-                return True
-            except ValueError:
-                continue
-        return False
+        return _is_valid_date_text(str(date_str))
 
     def _has_special_characters(self, text: str) -> bool:
-        allowed_pattern = r'^[a-zA-Z0-9\s.,@_-]+$'
-        return not re.match(allowed_pattern, text)
+        remainder = text.translate(_ALLOWED_CHARACTERS_TABLE)
+        return not text or not (remainder == '' or remainder.isspace())
 
     def _looks_like_system_code(self, code: str) -> bool:
-        patterns = [
-            r'^[A-F0-9]{8}-[A-F0-9]{4}-[A-F0-9]{4}-[A-F0-9]{4}-[A-F0-9]{12}$',
-            r'^[A-Z]{2,3}\d{3,}$',
-            r'^\d{6,}$',
-            r'^[A-Z0-9]{8,}$',
-        ]
-        
-        for pattern in patterns:
-            if re.match(pattern, code.upper()):
-                return True
-        return False
+        return _looks_like_system_code_text(code)
 
     def _has_non_ascii_characters(self, text: str) -> bool:
-        try:
-            text.encode('ascii')
-            return False
-        except UnicodeEncodeError:
-            return True
+        return not text.isascii()
+
     def _get_valid_system_codes(self, table_name: str, field_name: str) -> List[str]:
         """Get predefined valid system codes for specific table and field from external config"""
         return self.system_codes_config.get(table_name, {}).get(field_name, [])
 
-    def export_passed_checks_to_results_db(self, results: Dict[str, List[Dict]], results_manager) -> bool:
+    def _invalid_system_code_condition(self, table_name: str, field_name: str, column: str) -> tuple:
+        """SQL condition and parameters that are true for a value that is not a valid system code"""
+        valid_codes = self._get_valid_system_code_set(table_name, field_name)
+        if valid_codes:
+            placeholders = ', '.join('?' * len(valid_codes))
+            return f"dq_system_code({column}) NOT IN ({placeholders})", sorted(valid_codes)
+        # Fallback to pattern matching if no external config
+        return f"dq_invalid_system_code({column})", []
+
+    def _get_valid_system_code_set(self, table_name: str, field_name: str) -> frozenset:
+        """Uppercased valid codes for case-insensitive membership tests, built once per field"""
+        key = (table_name, field_name)
+        codes = self._system_code_sets.get(key)
+        if codes is None:
+            codes = frozenset(code.upper() for code in self._get_valid_system_codes(table_name, field_name))
+            self._system_code_sets[key] = codes
+        return codes
+
+    def export_passed_checks_to_results_db(self, results: Dict[str, List[CheckResult]], results_manager) -> bool:
         """Export passed data quality checks to Results database"""
         if not results:
             print(f"{Colors.WARNING}No results to export{Colors.ENDC}")
@@ -841,18 +978,22 @@ class DataQualityChecker:
         # Filter only passed results
         passed_records = []
         
+        # One date and timestamp for every record of this export
+        now = datetime.now()
+        export_date, export_timestamp = now.strftime("%Y-%m-%d"), now.isoformat()
+        
         for table_name, table_results in results.items():
             for result in table_results:
-                if result['status'] in ['PASS', 'INFO']:
+                if result.status in PASSED_STATUSES:
                     passed_records.append([
                         table_name,
-                        result['field'],
-                        result['check_type'],
-                        result['status'],
-                        result['message'],
+                        result.field,
+                        result.check_type,
+                        result.status,
+                        result.message,
                         "N/A",  # No specific failing values for passed checks
-                        datetime.now().strftime("%Y-%m-%d"),  # Date column
-                        datetime.now().isoformat()  # Timestamp column
+                        export_date,
+                        export_timestamp
                     ])
         
         if not passed_records:
@@ -887,97 +1028,100 @@ class DataQualityChecker:
             print(f"{Colors.FAIL}Error exporting passed checks to Results database{Colors.ENDC}")
             return False
 
+    def _failing_distinct_values(self, table_name: str, field_names: List[str], check_type: str) -> Dict[str, List[str]]:
+        """Up to 100 distinct non-blank values per field failing a validator, filtered in SQL.
+
+        The fields of one table share a single UNION ALL query per batch of fields."""
+        table = quote_identifier(table_name)
+        failing_values = {field_name: [] for field_name in field_names}
+        cursor = self.db_connection.cursor()
+        # SQLite caps a compound SELECT at 500 terms
+        for start in range(0, len(field_names), 500):
+            batch = field_names[start:start + 500]
+            selects = []
+            for position, field_name in enumerate(batch):
+                column = quote_identifier(field_name)
+                failing = self._failing_value_condition(column, check_type)
+                selects.append(f"""
+                    SELECT {position}, value FROM (
+                        SELECT DISTINCT {column} AS value FROM {table}
+                        WHERE {column} IS NOT NULL AND {column} != '' AND {failing}
+                        LIMIT 100
+                    )
+                """)
+            cursor.execute(' UNION ALL '.join(selects))
+            for position, value in cursor:
+                failing_values[batch[position]].append(str(value).strip())
+        return failing_values
+
+    def _failing_values_by_result(self, results: Dict[str, List[CheckResult]]) -> Dict[tuple, List[str]]:
+        """Failing values for every FAIL/ERROR result, keyed by (table, field, check_type)"""
+        failing_values = {}
+        batches = {}
+        for table_name, table_results in results.items():
+            for result in table_results:
+                if result.status not in FAILED_STATUSES:
+                    continue
+                key = (table_name, result.field, result.check_type)
+                if key[2] in FAILING_VALUE_VALIDATORS and self._column_exists(table_name, key[1]):
+                    batches.setdefault((table_name, key[2]), {})[key[1]] = None
+                else:
+                    failing_values[key] = self._get_failing_values_from_db(*key)
+        
+        for (table_name, check_type), field_names in batches.items():
+            try:
+                values = self._failing_distinct_values(table_name, list(field_names), check_type)
+            except sqlite3.Error as e:
+                values = {field_name: [f"Error retrieving values: {str(e)}"] for field_name in field_names}
+            for field_name, field_values in values.items():
+                failing_values[(table_name, field_name, check_type)] = field_values
+        return failing_values
+
     def _get_failing_values_from_db(self, table_name: str, field_name: str, check_type: str) -> List[str]:
         """Get actual failing values from database based on check type"""
         failing_values = []
         
         try:
             cursor = self.db_connection.cursor()
+            table, column = quote_identifier(table_name), quote_identifier(field_name)
             
             if check_type == 'null_check':
-                cursor.execute(f"SELECT COUNT(*) FROM {table_name} WHERE {field_name} IS NULL")
+                cursor.execute(f"SELECT COUNT(*) FROM {table} WHERE {column} IS NULL")
                 count = cursor.fetchone()[0]
                 failing_values = [f"NULL (found {count} occurrences)"]
 
             elif check_type == 'system_codes_check':
-                cursor.execute(f"SELECT DISTINCT {field_name} FROM {table_name} WHERE {field_name} IS NOT NULL AND {field_name} != '' LIMIT 100")
-                results = cursor.fetchall()
-                
                 # Get predefined valid codes for this table/field
                 valid_codes_list = self._get_valid_system_codes(table_name, field_name)
+                reason = "not in external config" if valid_codes_list else "pattern mismatch"
+                invalid_code, parameters = self._invalid_system_code_condition(table_name, field_name, column)
                 
-                for row in results:
-                    code = str(row[0]).strip().upper()
-                    original_code = str(row[0]).strip()
-                    
-                    if valid_codes_list:
-                        # Convert valid codes to uppercase for comparison
-                        valid_codes_upper = [vc.upper() for vc in valid_codes_list]
-                        if code not in valid_codes_upper:
-                            failing_values.append(f"{original_code} (not in external config)")
-                    else:
-                        # Fallback to pattern matching if no external config
-                        if not self._looks_like_system_code(code):
-                            failing_values.append(f"{original_code} (pattern mismatch)")
+                cursor.execute(f"""
+                    SELECT DISTINCT {column} FROM {table}
+                    WHERE {column} IS NOT NULL AND {column} != '' AND {invalid_code}
+                    LIMIT 100
+                """, parameters)
+                failing_values = [f"{str(row[0]).strip()} ({reason})" for row in cursor]
 
 
             elif check_type == 'blank_check':
-                cursor.execute(f"SELECT DISTINCT {field_name} FROM {table_name} WHERE {field_name} = '' OR {field_name} IS NULL LIMIT 50")
-                results = cursor.fetchall()
-                failing_values = [str(row[0]) if row[0] is not None else "NULL" for row in results]
+                cursor.execute(f"SELECT DISTINCT {column} FROM {table} WHERE {column} = '' OR {column} IS NULL LIMIT 50")
+                failing_values = [str(row[0]) if row[0] is not None else "NULL" for row in cursor]
                 
-            elif check_type == 'email_check':
-                cursor.execute(f"SELECT DISTINCT {field_name} FROM {table_name} WHERE {field_name} IS NOT NULL AND {field_name} != '' LIMIT 100")
-                results = cursor.fetchall()
-                for row in results:
-                    email = str(row[0]).strip()
-                    if not self._is_valid_email(email):
-                        failing_values.append(email)
-                        
-            elif check_type == 'phone_number_check':
-                cursor.execute(f"SELECT DISTINCT {field_name} FROM {table_name} WHERE {field_name} IS NOT NULL AND {field_name} != '' LIMIT 100")
-                results = cursor.fetchall()
-                for row in results:
-                    phone = str(row[0]).strip()
-                    if not self._is_valid_phone(phone):
-                        failing_values.append(phone)
-                        
-            elif check_type == 'date_check':
-                cursor.execute(f"SELECT DISTINCT {field_name} FROM {table_name} WHERE {field_name} IS NOT NULL AND {field_name} != '' LIMIT 100")
-                results = cursor.fetchall()
-                for row in results:
-                    date_str = str(row[0]).strip()
-                    if not self._is_valid_date(date_str):
-                        failing_values.append(date_str)
-                        
-            elif check_type == 'numeric_check':
-                cursor.execute(f"SELECT DISTINCT {field_name} FROM {table_name} WHERE {field_name} IS NOT NULL AND {field_name} != '' LIMIT 100")
-                results = cursor.fetchall()
-                for row in results:
-                    val_str = str(row[0]).strip()
-                    if not self._is_numeric(val_str):
-                        failing_values.append(val_str)
+            elif check_type in FAILING_VALUE_VALIDATORS:
+                failing_values = self._failing_distinct_values(table_name, [field_name], check_type)[field_name]
                         
             elif check_type == 'duplicate_check':
                 cursor.execute(f"""
-                    SELECT {field_name}, COUNT(*) as count
-                    FROM {table_name}
-                    WHERE {field_name} IS NOT NULL
-                    GROUP BY {field_name}
+                    SELECT {column}, COUNT(*) as count
+                    FROM {table}
+                    WHERE {column} IS NOT NULL
+                    GROUP BY {column}
                     HAVING COUNT(*) > 1
                     ORDER BY count DESC
                     LIMIT 50
                 """)
-                results = cursor.fetchall()
-                failing_values = [f"{row[0]} (appears {row[1]} times)" for row in results]
-                
-            elif check_type == 'special_characters_check':
-                cursor.execute(f"SELECT DISTINCT {field_name} FROM {table_name} WHERE {field_name} IS NOT NULL AND {field_name} != '' LIMIT 100")
-                results = cursor.fetchall()
-                for row in results:
-                    text = str(row[0]).strip()
-                    if self._has_special_characters(text):
-                        failing_values.append(text)
+                failing_values = [f"{row[0]} (appears {row[1]} times)" for row in cursor]
                 
             # Limit the number of failing values to prevent huge files
             if len(failing_values) > 100:
@@ -989,32 +1133,102 @@ class DataQualityChecker:
         
         return failing_values
 
-    def run_all_checks(self) -> Dict[str, List[Dict]]:
+    def run_all_checks(self) -> Dict[str, List[CheckResult]]:
         if not self.checks_config:
             print("No checks configuration loaded")
             return {}
 
+        existing_tables = {table_name for table_name in self.checks_config if self._table_exists(table_name)}
+        database_path = self._database_path()
+        workers = min(len(existing_tables), os.cpu_count() or 1)
+        executor = None
+        pending = {}
+        if database_path and workers > 1:
+            # Tables are independent, so each runs on its own read-only connection
+            database_uri = Path(database_path).as_uri() + '?mode=ro'
+            executor = ThreadPoolExecutor(max_workers=workers)
+            pending = {
+                table_name: executor.submit(self._run_table_checks_readonly, database_uri, table_name)
+                for table_name in self.checks_config if table_name in existing_tables
+            }
+
         results = {}
-        for table_name, fields in self.checks_config.items():
-            print(f"\nRunning checks for table: {table_name}")
-            
-            if not self._table_exists(table_name):
-                print(f"Table '{table_name}' does not exist in database")
-                continue
+        try:
+            for table_name, fields in self.checks_config.items():
+                print(f"\nRunning checks for table: {table_name}")
+                
+                if table_name not in existing_tables:
+                    print(f"Table '{table_name}' does not exist in database")
+                    continue
 
-            table_results = []
-            for field_name, checks in fields.items():
-                print(f"  Checking field: {field_name}")
-                field_results = self._run_field_checks(table_name, field_name, checks)
-                if field_results:
-                    table_results.extend(field_results)
+                for field_name in fields:
+                    print(f"  Checking field: {field_name}")
+                if table_name in pending:
+                    try:
+                        table_results = pending[table_name].result()
+                    except Exception:
+                        table_results = None
+                    if table_results is None:
+                        # The worker's read-only connection failed (locked database, URI-special path, ...);
+                        # the table is checked on the main connection instead
+                        table_results = self._run_table_checks(table_name)
+                else:
+                    table_results = self._run_table_checks(table_name)
 
-            if table_results:
-                results[table_name] = table_results
+                if table_results:
+                    results[table_name] = table_results
+        finally:
+            if executor:
+                executor.shutdown()
 
         return results
 
-    def print_results(self, results: Dict[str, List[Dict]]):
+    def _run_table_checks(self, table_name: str) -> List[CheckResult]:
+        table_results = []
+        for field_name, checks in self.checks_config[table_name].items():
+            field_results = self._run_field_checks(table_name, field_name, checks)
+            if field_results:
+                table_results.extend(field_results)
+        return table_results
+
+    def _run_table_checks_readonly(self, database_uri: str, table_name: str) -> Optional[List[CheckResult]]:
+        """Run one table's checks on a separate read-only connection, for use from a worker thread.
+
+        Returns None when the connection hit a database error, so the caller can re-run the
+        table on the main connection.
+        """
+        connection = sqlite3.connect(database_uri, uri=True)
+        try:
+            for pragma in DATABASE_PRAGMAS:
+                connection.execute(pragma)
+            worker = DataQualityChecker(connection)
+            worker.checks_config = self.checks_config
+            worker.system_codes_config = self.system_codes_config
+            # Caches are the worker's own; only the parent thread writes to the parent's
+            worker._system_code_sets = dict(self._system_code_sets)
+            # Read the columns here rather than through _column_exists, which would turn a
+            # locked database into false "does not exist" failures
+            cursor = connection.execute(f"PRAGMA table_info({quote_identifier(table_name)})")
+            worker._columns = {table_name: frozenset(row[1] for row in cursor)}
+            table_results = worker._run_table_checks(table_name)
+            # _run_field_checks reports database errors (e.g. SQLITE_BUSY) as ERROR results
+            if any(result.status == 'ERROR' for result in table_results):
+                return None
+            return table_results
+        finally:
+            connection.close()
+
+    def _database_path(self) -> str:
+        """File behind the main database, or '' for in-memory and temporary databases"""
+        try:
+            for _, name, path in self.db_connection.execute("PRAGMA database_list"):
+                if name == 'main':
+                    return path
+        except sqlite3.Error:
+            pass
+        return ''
+
+    def print_results(self, results: Dict[str, List[CheckResult]]):
         if not results:
             print(f"{Colors.WARNING}No data quality issues found or no checks were run{Colors.ENDC}")
             return
@@ -1028,13 +1242,13 @@ class DataQualityChecker:
         failed_checks = 0
         warnings = 0
 
+        # Each table's block is formatted first and written once
         for table_name, table_results in results.items():
-            print(f"\n{Colors.BOLD}{Colors.UNDERLINE}Table: {table_name}{Colors.ENDC}")
-            print("-" * 60)
+            lines = [f"\n{Colors.BOLD}{Colors.UNDERLINE}Table: {table_name}{Colors.ENDC}", "-" * 60]
 
             for result in table_results:
                 total_checks += 1
-                status = result['status']
+                status = result.status
                 
                 if status == 'PASS':
                     color = Colors.OKGREEN
@@ -1049,15 +1263,16 @@ class DataQualityChecker:
                     color = Colors.FAIL
                     failed_checks += 1
 
-                print(f"{color}[{status}]{Colors.ENDC} {result['field']} - {result['check_type']}")
-                print(f"  {result['message']}")
-                print()
+                lines.append(f"{color}[{status}]{Colors.ENDC} {result.field} - {result.check_type}")
+                lines.append(f"  {result.message}")
+                lines.append("")
+            sys.stdout.write("\n".join(lines) + "\n")
 
         print(f"\n{Colors.BOLD}{'='*80}{Colors.ENDC}")
         print(f"{Colors.BOLD}SUMMARY: Total: {total_checks}, Passed: {passed_checks}, Failed: {failed_checks}, Warnings: {warnings}{Colors.ENDC}")
         print(f"{Colors.BOLD}{'='*80}{Colors.ENDC}")
 
-    def print_fields_status_summary(self, results: Dict[str, List[Dict]]):
+    def print_fields_status_summary(self, results: Dict[str, List[CheckResult]]):
         if not results:
             return
 
@@ -1071,15 +1286,15 @@ class DataQualityChecker:
 
             field_status = {}
             for result in table_results:
-                field_name = result['field']
+                field_name = result.field
                 if field_name not in field_status:
                     field_status[field_name] = {'pass': 0, 'fail': 0, 'warning': 0}
                 
-                if result['status'] == 'PASS':
+                if result.status == 'PASS':
                     field_status[field_name]['pass'] += 1
-                elif result['status'] == 'FAIL':
+                elif result.status == 'FAIL':
                     field_status[field_name]['fail'] += 1
-                elif result['status'] == 'WARNING':
+                elif result.status == 'WARNING':
                     field_status[field_name]['warning'] += 1
 
             for field_name, status in field_status.items():
@@ -1097,7 +1312,7 @@ class DataQualityChecker:
                       f"(P:{status['pass']}, F:{status['fail']}, W:{status['warning']})")
 
 
-    def export_failed_checks_to_results_db(self, results: Dict[str, List[Dict]], results_manager) -> bool:
+    def export_failed_checks_to_results_db(self, results: Dict[str, List[CheckResult]], results_manager) -> bool:
         """Export failed data quality checks to Results database"""
         if not results:
             print(f"{Colors.WARNING}No results to export{Colors.ENDC}")
@@ -1105,38 +1320,41 @@ class DataQualityChecker:
         
         # Filter only failed and error results
         failed_records = []
+        # Get actual failing values from database
+        failing_by_result = self._failing_values_by_result(results)
+        
+        # One date and timestamp for every record of this export
+        now = datetime.now()
+        export_date, export_timestamp = now.strftime("%Y-%m-%d"), now.isoformat()
         
         for table_name, table_results in results.items():
             for result in table_results:
-                if result['status'] in ['FAIL', 'ERROR']:
-                    # Get actual failing values from database
-                    failing_values = self._get_failing_values_from_db(
-                        table_name, result['field'], result['check_type']
-                    )
+                if result.status in FAILED_STATUSES:
+                    failing_values = failing_by_result[(table_name, result.field, result.check_type)]
                     
                     # Create a record for each failing value or one record if no specific values
                     if failing_values:
                         for failing_value in failing_values:
                             failed_records.append([
                                 table_name,
-                                result['field'],
-                                result['check_type'],
-                                result['status'],
-                                result['message'],
+                                result.field,
+                                result.check_type,
+                                result.status,
+                                result.message,
                                 failing_value,
-                                datetime.now().strftime("%Y-%m-%d"),  # Date column
-                                datetime.now().isoformat()  # Timestamp column
+                                export_date,
+                                export_timestamp
                             ])
                     else:
                         failed_records.append([
                             table_name,
-                            result['field'],
-                            result['check_type'],
-                            result['status'],
-                            result['message'],
+                            result.field,
+                            result.check_type,
+                            result.status,
+                            result.message,
                             "No specific values",
-                            datetime.now().strftime("%Y-%m-%d"),  # Date column
-                            datetime.now().isoformat()  # Timestamp column
+                            export_date,
+                            export_timestamp
                         ])
         
         if not failed_records:
@@ -1171,7 +1389,7 @@ class DataQualityChecker:
             print(f"{Colors.FAIL}Error exporting failed checks to Results database{Colors.ENDC}")
             return False
 
-    def export_results_to_csv(self, results: Dict[str, List[Dict]]):
+    def export_results_to_csv(self, results: Dict[str, List[CheckResult]]):
         """Export ALL results to CSV (both passed and failed)"""
         if not results:
             print(f"{Colors.WARNING}No results to export{Colors.ENDC}")
@@ -1181,24 +1399,18 @@ class DataQualityChecker:
         filename = f"data_quality_report_{timestamp}.csv"
 
         try:
-            current_dir = os.getcwd()
-            full_filepath = os.path.join(current_dir, filename)
+            full_filepath = str(self._cwd / filename)
             
-            with open(full_filepath, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = ['table', 'field', 'check_type', 'status', 'message', 'timestamp']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-
-                for table_name, table_results in results.items():
-                    for result in table_results:
-                        writer.writerow({
-                            'table': result['table'],
-                            'field': result['field'],
-                            'check_type': result['check_type'],
-                            'status': result['status'],
-                            'message': result['message'],
-                            'timestamp': datetime.now().isoformat()
-                        })
+            with open(full_filepath, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(['table', 'field', 'check_type', 'status', 'message', 'timestamp'])
+
+                export_timestamp = datetime.now().isoformat()
+                writer.writerows(
+                    [result.table, result.field, result.check_type, result.status, result.message, export_timestamp]
+                    for table_results in results.values()
+                    for result in table_results
+                )
 
             if os.path.exists(full_filepath):
                 file_size = os.path.getsize(full_filepath)
@@ -1207,7 +1419,7 @@ class DataQualityChecker:
                 
                 # Check if there are any failures to export detailed values
                 has_failures = any(
-                    result['status'] in ['FAIL', 'ERROR'] 
+                    result.status in FAILED_STATUSES 
                     for table_results in results.values() 
                     for result in table_results
                 )
@@ -1220,56 +1432,44 @@ class DataQualityChecker:
 
         except Exception as e:
             print(f"{Colors.FAIL}Error exporting results: {str(e)}{Colors.ENDC}")
-            print(f"{Colors.WARNING}Current directory: {os.getcwd()}{Colors.ENDC}")
+            print(f"{Colors.WARNING}Current directory: {self._cwd}{Colors.ENDC}")
 
-    def export_failing_values_to_csv(self, results: Dict[str, List[Dict]], filename: str = None):
+    def export_failing_values_to_csv(self, results: Dict[str, List[CheckResult]], filename: str = None):
         """Export detailed failing values to a separate CSV"""
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"failing_values_detailed_{timestamp}.csv"
 
         try:
-            current_dir = os.getcwd()
-            full_filepath = os.path.join(current_dir, filename)
+            full_filepath = str(self._cwd / filename)
             
-            failing_records = []
+            export_timestamp = datetime.now().isoformat()
             
-            # Collect all failing values from the database
-            for table_name, table_results in results.items():
-                for result in table_results:
-                    if result['status'] in ['FAIL', 'ERROR']:
-                        field_name = result['field']
-                        check_type = result['check_type']
-                        
-                        # Get actual failing values from database
-                        failing_values = self._get_failing_values_from_db(
-                            table_name, field_name, check_type
-                        )
-                        
-                        for failing_value in failing_values:
-                            failing_records.append({
-                                'table': table_name,
-                                'field_name': field_name,
-                                'check_type': check_type,
-                                'failing_value': failing_value,
-                                'status': result['status'],
-                                'message': result['message'],
-                                'timestamp': datetime.now().isoformat()
-                            })
-
-            if failing_records:
-                with open(full_filepath, 'w', newline='', encoding='utf-8') as csvfile:
-                    fieldnames = ['table', 'field_name', 'check_type', 'failing_value', 'status', 'message', 'timestamp']
-                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                    writer.writeheader()
-                    
-                    for record in failing_records:
-                        writer.writerow(record)
+            # Collect all failing values from the database; records are expanded only while writing
+            failing_by_result = self._failing_values_by_result(results)
+            failing_results = [
+                (table_name, result, failing_by_result[(table_name, result.field, result.check_type)])
+                for table_name, table_results in results.items()
+                for result in table_results
+                if result.status in FAILED_STATUSES
+            ]
+            record_count = sum(len(failing_values) for _, _, failing_values in failing_results)
+
+            if record_count:
+                with open(full_filepath, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as csvfile:
+                    writer = csv.writer(csvfile)
+                    writer.writerow(['table', 'field_name', 'check_type', 'failing_value', 'status', 'message', 'timestamp'])
+                    writer.writerows(
+                        (table_name, result.field, result.check_type, failing_value,
+                         result.status, result.message, export_timestamp)
+                        for table_name, result, failing_values in failing_results
+                        for failing_value in failing_values
+                    )
 
                 if os.path.exists(full_filepath):
                     file_size = os.path.getsize(full_filepath)
                     print(f"{Colors.OKGREEN}✓ Failing values exported to: {full_filepath}{Colors.ENDC}")
-                    print(f"{Colors.OKCYAN}  Total failing records: {len(failing_records)}{Colors.ENDC}")
+                    print(f"{Colors.OKCYAN}  Total failing records: {record_count}{Colors.ENDC}")
                     print(f"{Colors.OKCYAN}  File size: {file_size} bytes{Colors.ENDC}")
                 else:
                     print(f"{Colors.FAIL}Error: Failing values file was not created{Colors.ENDC}")
@@ -1278,9 +1478,9 @@ class DataQualityChecker:
 
         except Exception as e:
             print(f"{Colors.FAIL}Error exporting failing values: {str(e)}{Colors.ENDC}")
-            print(f"{Colors.WARNING}Current directory: {os.getcwd()}{Colors.ENDC}")
+            print(f"{Colors.WARNING}Current directory: {self._cwd}{Colors.ENDC}")
 
-    def run_checks_for_specific_table(self, table_name: str) -> Dict[str, List[Dict]]:
+    def run_checks_for_specific_table(self, table_name: str) -> Dict[str, List[CheckResult]]:
         """Run data quality checks for a specific table"""
         if table_name not in self.checks_config:
             print(f"{Colors.FAIL}No configuration found for table: {table_name}{Colors.ENDC}")
@@ -1290,32 +1490,22 @@ class DataQualityChecker:
             print(f"{Colors.WARNING}Table '{table_name}' does not exist in database{Colors.ENDC}")
             return {}
 
-        table_results = []
-        fields = self.checks_config[table_name]
-        
-        for field_name, checks in fields.items():
-            field_results = self._run_field_checks(table_name, field_name, checks)
-            if field_results:
-                table_results.extend(field_results)
-
+        table_results = self._run_table_checks(table_name)
         if table_results:
             return {table_name: table_results}
         else:
             return {}
 
-    def get_failed_fields_summary(self, results: Dict[str, List[Dict]]) -> Dict[str, Dict[str, List[str]]]:
+    def get_failed_fields_summary(self, results: Dict[str, List[CheckResult]]) -> Dict[str, Dict[str, List[str]]]:
         """Get a summary of fields that have failed checks"""
         failed_fields = {}
         
         for table_name, table_results in results.items():
-            table_failed_fields = {}
+            table_failed_fields = defaultdict(list)
             
             for result in table_results:
-                if result['status'] in ['FAIL', 'ERROR']:
-                    field_name = result['field']
-                    if field_name not in table_failed_fields:
-                        table_failed_fields[field_name] = []
-                    table_failed_fields[field_name].append(result['check_type'])
+                if result.status in FAILED_STATUSES:
+                    table_failed_fields[result.field].append(result.check_type)
             
             if table_failed_fields:
                 failed_fields[table_name] = table_failed_fields
@@ -1334,9 +1524,16 @@ class ResultsManager:
     def _initialize_results_db(self):
         """Initialize the Results database and create metadata table"""
         try:
-            self.results_connection = sqlite3.connect(self.results_db_path)
+            # Autocommit mode; statements that belong together are grouped with explicit BEGIN/COMMIT
+            self.results_connection = sqlite3.connect(self.results_db_path, isolation_level=None)
             cursor = self.results_connection.cursor()
             
+            # WAL with synchronous=NORMAL syncs on checkpoints instead of on every commit
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.execute("PRAGMA cache_size=-65536")
+            
             # Create metadata table to track query executions
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS query_metadata (
@@ -1353,7 +1550,6 @@ class ResultsManager:
                 )
             ''')
             
-            self.results_connection.commit()
             print(f"{Colors.OKGREEN}✓ Results database initialized: {self.results_db_path}{Colors.ENDC}")
             
         except sqlite3.Error as e:
@@ -1361,11 +1557,14 @@ class ResultsManager:
     
     def _get_next_version(self, base_table_name: str) -> int:
         """Get the next version number for a table"""
+        # A range over the prefix can use the UNIQUE(table_name, version) index; LIKE cannot,
+        # since it is case-insensitive and '_' in the generated names is a wildcard
+        upper_bound = base_table_name[:-1] + chr(ord(base_table_name[-1]) + 1)
         cursor = self.results_connection.cursor()
         cursor.execute('''
             SELECT MAX(version) FROM query_metadata 
-            WHERE table_name LIKE ? || '%'
-        ''', (base_table_name,))
+            WHERE table_name >= ? AND table_name < ?
+        ''', (base_table_name, upper_bound))
         
         result = cursor.fetchone()
         max_version = result[0] if result[0] is not None else 0
@@ -1395,62 +1594,89 @@ class ResultsManager:
         table_name = f"{base_table_name}_v{version}"
         return table_name, version
 
-    def store_passed_checks_results(self, passed_records: List[List], column_names: List[str], description: str = "") -> Optional[str]:
-        """Store passed data quality check results in the Results database"""
-        if not passed_records or not column_names:
-            print(f"{Colors.WARNING}No passed check results to store{Colors.ENDC}")
-            return None
-
-        try:
-            table_name, version = self._generate_passed_checks_table_name()
-            cursor = self.results_connection.cursor()
-
-            # Create table structure for passed checks
-            columns_def = [
-                "result_id INTEGER PRIMARY KEY AUTOINCREMENT"
-            ]
-            
-            # Add all columns
-            for col_name in column_names:
-                columns_def.append(f"'{col_name}' TEXT")
-
-            create_table_sql = f'''
-            CREATE TABLE {table_name} (
+    def _store_table(self, table_name: str, version: int, columns_def: List[str], column_names: List[str],
+                     rows: Iterable, original_query: str, description: str) -> int:
+        """Create a result table, fill it and record its metadata in one transaction.
+
+        rows may be any iterable and is consumed once; the number of rows stored is returned.
+        """
+        # Identifiers are double-quoted once and shared by CREATE and INSERT
+        table = quote_identifier(table_name)
+        column_names_quoted = [quote_identifier(col_name) for col_name in column_names]
+        columns_def = columns_def + [f"{col} TEXT" for col in column_names_quoted]
+        create_table_sql = f'''
+            CREATE TABLE {table} (
                 {', '.join(columns_def)}
             )
-            '''
-
-            cursor.execute(create_table_sql)
-
-            # Insert data
-            placeholders = ', '.join(['?' for _ in column_names])
-            column_names_quoted = [f"'{col}'" for col in column_names]
-            insert_sql = f"INSERT INTO {table_name} ({', '.join(column_names_quoted)}) VALUES ({placeholders})"
-            
-            cursor.executemany(insert_sql, passed_records)
-
-            # Store metadata with a special query indicator for passed checks
-            metadata_sql = '''
+        '''
+        
+        placeholders = ', '.join(['?' for _ in column_names])
+        insert_sql = f"INSERT INTO {table} ({', '.join(column_names_quoted)}) VALUES ({placeholders})"
+        
+        metadata_sql = '''
             INSERT INTO query_metadata
             (table_name, execution_date, version, original_query, row_count, column_count, description, created_timestamp)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            '''
-            
-            current_timestamp = datetime.now().isoformat()
-            current_date = datetime.now().strftime("%Y-%m-%d")
-            
+        '''
+        now = datetime.now()
+        
+        # One transaction covers the CREATE TABLE too, so a failure leaves nothing behind
+        # and the whole store costs a single commit; inside transaction() it becomes a savepoint
+        cursor = self.results_connection.cursor()
+        nested = self.results_connection.in_transaction
+        cursor.execute("SAVEPOINT store_table" if nested else "BEGIN IMMEDIATE")
+        try:
+            cursor.execute(create_table_sql)
+            cursor.executemany(insert_sql, rows)
+            row_count = cursor.rowcount
             cursor.execute(metadata_sql, (
                 table_name,
-                current_date,
+                now.strftime("%Y-%m-%d"),
                 version,
-                "DATA_QUALITY_PASSED_CHECKS_EXPORT",  # Special identifier
-                len(passed_records),
+                original_query,
+                row_count,
                 len(column_names),
                 description,
-                current_timestamp
+                now.isoformat()
             ))
+        except Exception:
+            if nested:
+                cursor.execute("ROLLBACK TO store_table")
+                cursor.execute("RELEASE store_table")
+            else:
+                cursor.execute("ROLLBACK")
+            raise
+        cursor.execute("RELEASE store_table" if nested else "COMMIT")
+        return row_count
+
+    @contextmanager
+    def transaction(self):
+        """Group several stores into one Results.db transaction; a store that fails is undone on its own"""
+        if not self.results_connection:
+            yield
+            return
+        self.results_connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self.results_connection.execute("ROLLBACK")
+            raise
+        self.results_connection.execute("COMMIT")
+
+    def store_passed_checks_results(self, passed_records: List[List], column_names: List[str], description: str = "") -> Optional[str]:
+        """Store passed data quality check results in the Results database"""
+        if not passed_records or not column_names:
+            print(f"{Colors.WARNING}No passed check results to store{Colors.ENDC}")
+            return None
 
-            self.results_connection.commit()
+        try:
+            table_name, version = self._generate_passed_checks_table_name()
+            columns_def = ["result_id INTEGER PRIMARY KEY AUTOINCREMENT"]
+            self._store_table(
+                table_name, version, columns_def, column_names, passed_records,
+                "DATA_QUALITY_PASSED_CHECKS_EXPORT",  # Special identifier
+                description
+            )
 
             print(f"{Colors.OKGREEN}✓ Passed checks stored in table: {table_name}{Colors.ENDC}")
             print(f"{Colors.OKCYAN} - Passed records stored: {len(passed_records)}{Colors.ENDC}")
@@ -1472,54 +1698,12 @@ class ResultsManager:
 
         try:
             table_name, version = self._generate_failed_checks_table_name()
-            cursor = self.results_connection.cursor()
-
-            # Create table structure for failed checks
-            columns_def = [
-                "result_id INTEGER PRIMARY KEY AUTOINCREMENT"
-            ]
-            
-            # Add all columns
-            for col_name in column_names:
-                columns_def.append(f"'{col_name}' TEXT")
-
-            create_table_sql = f'''
-            CREATE TABLE {table_name} (
-                {', '.join(columns_def)}
-            )
-            '''
-
-            cursor.execute(create_table_sql)
-
-            # Insert data
-            placeholders = ', '.join(['?' for _ in column_names])
-            column_names_quoted = [f"'{col}'" for col in column_names]
-            insert_sql = f"INSERT INTO {table_name} ({', '.join(column_names_quoted)}) VALUES ({placeholders})"
-            
-            cursor.executemany(insert_sql, failed_records)
-
-            # Store metadata with a special query indicator for failed checks
-            metadata_sql = '''
-            INSERT INTO query_metadata
-            (table_name, execution_date, version, original_query, row_count, column_count, description, created_timestamp)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            '''
-            
-            current_timestamp = datetime.now().isoformat()
-            current_date = datetime.now().strftime("%Y-%m-%d")
-            
-            cursor.execute(metadata_sql, (
-                table_name,
-                current_date,
-                version,
+            columns_def = ["result_id INTEGER PRIMARY KEY AUTOINCREMENT"]
+            self._store_table(
+                table_name, version, columns_def, column_names, failed_records,
                 "DATA_QUALITY_FAILED_CHECKS_EXPORT",  # Special identifier
-                len(failed_records),
-                len(column_names),
-                description,
-                current_timestamp
-            ))
-
-            self.results_connection.commit()
+                description
+            )
 
             print(f"{Colors.OKGREEN}✓ Failed checks stored in table: {table_name}{Colors.ENDC}")
             print(f"{Colors.OKCYAN} - Failed records stored: {len(failed_records)}{Colors.ENDC}")
@@ -1532,70 +1716,27 @@ class ResultsManager:
             print(f"{Colors.FAIL}Error storing failed checks: {str(e)}{Colors.ENDC}")
             return None
 
-    def store_query_results(self, query: str, results: List[tuple], column_names: List[str],description: str = "") -> Optional[str]:
-        """Store query results in the Results database"""
+    def store_query_results(self, query: str, results: Iterable[tuple], column_names: List[str],description: str = "") -> Optional[str]:
+        """Store query results in the Results database.
+
+        results may be a list or a lazy iterator of rows; it is consumed once.
+        """
         if not results or not column_names:
             print(f"{Colors.WARNING}No results to store{Colors.ENDC}")
             return None
         
         try:
             table_name, version = self._generate_table_name()
-            cursor = self.results_connection.cursor()
             
             # Check if 'id' column already exists in the original results
             has_id_column = 'id' in [col.lower() for col in column_names]
             
-            # Create table structure based on results
-            columns_def = []
-            
             # Only add auto-increment ID if the original results don't have an 'id' column
-            if not has_id_column:
-                columns_def.append("result_id INTEGER PRIMARY KEY AUTOINCREMENT")
-            
-            # Add all original columns
-            for col_name in column_names:
-                columns_def.append(f"'{col_name}' TEXT")
-            
-            create_table_sql = f'''
-                CREATE TABLE {table_name} (
-                    {', '.join(columns_def)}
-                )
-            '''
-            
-            cursor.execute(create_table_sql)
-            
-            # Insert data
-            placeholders = ', '.join(['?' for _ in column_names])
-            column_names_quoted = [f"'{col}'" for col in column_names]
-            insert_sql = f"INSERT INTO {table_name} ({', '.join(column_names_quoted)}) VALUES ({placeholders})"
-            
-            cursor.executemany(insert_sql, results)
-            
-            # Store metadata
-            metadata_sql = '''
-                INSERT INTO query_metadata 
-                (table_name, execution_date, version, original_query, row_count, column_count, description, created_timestamp)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            '''
-            
-            current_timestamp = datetime.now().isoformat()
-            current_date = datetime.now().strftime("%Y-%m-%d")
-            
-            cursor.execute(metadata_sql, (
-                table_name,
-                current_date,
-                version,
-                query,
-                len(results),
-                len(column_names),
-                description,
-                current_timestamp
-            ))
-            
-            self.results_connection.commit()
+            columns_def = [] if has_id_column else ["result_id INTEGER PRIMARY KEY AUTOINCREMENT"]
+            row_count = self._store_table(table_name, version, columns_def, column_names, results, query, description)
             
             print(f"{Colors.OKGREEN}✓ Results stored in table: {table_name}{Colors.ENDC}")
-            print(f"{Colors.OKCYAN}  - Rows stored: {len(results)}{Colors.ENDC}")
+            print(f"{Colors.OKCYAN}  - Rows stored: {row_count}{Colors.ENDC}")
             print(f"{Colors.OKCYAN}  - Columns: {len(column_names)}{Colors.ENDC}")
             print(f"{Colors.OKCYAN}  - Version: {version}{Colors.ENDC}")
             if has_id_column:
@@ -1619,7 +1760,9 @@ class ResultsManager:
                 ORDER BY created_timestamp DESC
             ''')
             
-            results = cursor.fetchall()
+            # Entries are read and written a batch at a time
+            cursor.arraysize = 100
+            results = cursor.fetchmany()
             
             if not results:
                 print(f"{Colors.WARNING}No stored results found{Colors.ENDC}")
@@ -1629,16 +1772,21 @@ class ResultsManager:
             print(f"{Colors.BOLD}STORED QUERY RESULTS{Colors.ENDC}")
             print(f"{Colors.BOLD}{'='*100}{Colors.ENDC}")
             
-            for result in results:
-                table_name, exec_date, version, row_count, col_count, desc, timestamp, query = result
-                
-                print(f"\n{Colors.BOLD}Table: {table_name}{Colors.ENDC}")
-                print(f"Date: {exec_date} | Version: {version} | Rows: {row_count} | Columns: {col_count}")
-                print(f"Created: {timestamp}")
-                if desc:
-                    print(f"Description: {desc}")
-                print(f"Query: {query[:100]}{'...' if len(query) > 100 else ''}")
-                print("-" * 80)
+            # Format each batch of entries and write it once
+            while results:
+                lines = []
+                for result in results:
+                    table_name, exec_date, version, row_count, col_count, desc, timestamp, query = result
+                    
+                    lines.append(f"\n{Colors.BOLD}Table: {table_name}{Colors.ENDC}")
+                    lines.append(f"Date: {exec_date} | Version: {version} | Rows: {row_count} | Columns: {col_count}")
+                    lines.append(f"Created: {timestamp}")
+                    if desc:
+                        lines.append(f"Description: {desc}")
+                    lines.append(f"Query: {query[:100]}{'...' if len(query) > 100 else ''}")
+                    lines.append("-" * 80)
+                sys.stdout.write("\n".join(lines) + "\n")
+                results = cursor.fetchmany()
                 
         except sqlite3.Error as e:
             print(f"{Colors.FAIL}Error listing results: {str(e)}{Colors.ENDC}")
@@ -1647,8 +1795,10 @@ class ResultsManager:
         """View data from a stored result table"""
         try:
             cursor = self.results_connection.cursor()
-            cursor.execute(f"SELECT * FROM {table_name} LIMIT 100")
-            results = cursor.fetchall()
+            cursor.execute(f"SELECT * FROM {quote_identifier(table_name)} LIMIT 100")
+            # Rows are read and written a batch at a time
+            cursor.arraysize = 100
+            results = cursor.fetchmany()
             
             if not results:
                 print(f"{Colors.WARNING}No data found in table {table_name}{Colors.ENDC}")
@@ -1659,18 +1809,19 @@ class ResultsManager:
             print(f"\n{Colors.OKGREEN}Data from table: {table_name}{Colors.ENDC}")
             print("-" * 100)
             
-            # Print header
+            # Format the header and each batch of rows and write them once
             header = " | ".join(f"{col:15}" for col in column_names)
-            print(f"{Colors.BOLD}{header}{Colors.ENDC}")
-            print("-" * 100)
-            
-            # Print data
-            for row in results:
-                row_str = " | ".join(f"{str(val):15}" for val in row)
-                print(row_str)
+            sys.stdout.write(f"{Colors.BOLD}{header}{Colors.ENDC}\n" + "-" * 100 + "\n")
+            # One %-format per row, same padding as f"{str(val):15}" per cell
+            row_format = " | ".join(["%-15s"] * len(column_names)) + "\n"
+            row_count = 0
+            while results:
+                row_count += len(results)
+                sys.stdout.write("".join(row_format % tuple(row) for row in results))
+                results = cursor.fetchmany()
             
             print("-" * 100)
-            print(f"{Colors.OKCYAN}Showing {len(results)} rows (limited to 100){Colors.ENDC}")
+            print(f"{Colors.OKCYAN}Showing {row_count} rows (limited to 100){Colors.ENDC}")
             
         except sqlite3.Error as e:
             print(f"{Colors.FAIL}Error viewing stored result: {str(e)}{Colors.ENDC}")
@@ -1686,13 +1837,15 @@ class ResultsManager:
                 print(f"{Colors.FAIL}Table {table_name} not found{Colors.ENDC}")
                 return
             
-            # Delete the table
-            cursor.execute(f"DROP TABLE {table_name}")
-            
-            # Delete metadata
-            cursor.execute("DELETE FROM query_metadata WHERE table_name = ?", (table_name,))
-            
-            self.results_connection.commit()
+            # Delete the table and its metadata together
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                cursor.execute(f"DROP TABLE {quote_identifier(table_name)}")
+                cursor.execute("DELETE FROM query_metadata WHERE table_name = ?", (table_name,))
+            except sqlite3.Error:
+                cursor.execute("ROLLBACK")
+                raise
+            cursor.execute("COMMIT")
             print(f"{Colors.OKGREEN}✓ Deleted stored result: {table_name}{Colors.ENDC}")
             
         except sqlite3.Error as e:
@@ -1712,9 +1865,12 @@ class SQLGenerator:
         self.groq_api_key = groq_api_key or os.getenv('GROQ_API_KEY')
         self.groq_base_url = "https://api.groq.com/openai/v1/chat/completions"
         self.model = "meta-llama/llama-4-maverick-17b-128e-instruct"
+        self._http = None  # requests.Session reused across Groq API calls, created on first use
         self.db_connection = None
         self.db_path = None
+        self._schema_cache = None  # (original, masked) schema strings for the current connection
         self.data_quality_checker = None
+        self._last_dq_results = None  # latest run_all_checks results; cleared when the data or config changes
         self.results_manager = ResultsManager()
         self.masking_manager = DataMaskingManager()  # Add this line
         
@@ -1752,6 +1908,7 @@ class SQLGenerator:
 
         success = self.data_quality_checker.load_system_codes_config(csv_path)
         if success:
+            self._last_dq_results = None
             print(f"{Colors.OKGREEN}✓ System codes configuration loaded successfully{Colors.ENDC}")
     def generate_sql_query(self, user_request: str, original_schema_info: str = "", masked_schema_info: str = "") -> Optional[str]:
         """Generate SQL query using Groq API with masked data"""
@@ -1759,6 +1916,13 @@ class SQLGenerator:
             print(f"{Colors.FAIL}Error: Groq API key not configured{Colors.ENDC}")
             return None
 
+        # requests is only needed here, so it is imported on the first generated query rather than at startup
+        import requests
+        if self._http is None:
+            # One pooled keep-alive connection to the Groq API serves every query
+            self._http = requests.Session()
+            self._http.headers.update({"Content-Type": "application/json"})
+
         # Mask the user request
         masked_user_request = self.masking_manager.mask_user_query(user_request, original_schema_info)
         
@@ -1775,10 +1939,8 @@ class SQLGenerator:
 
     Generate SQL query for the following request:"""
 
-        headers = {
-            "Authorization": f"Bearer {self.groq_api_key}",
-            "Content-Type": "application/json"
-        }
+        # The key can be replaced from the menu, so it is sent per request rather than stored on the session
+        headers = {"Authorization": f"Bearer {self.groq_api_key}"}
 
         payload = {
             "model": self.model,
@@ -1792,14 +1954,12 @@ class SQLGenerator:
 
         try:
             print(f"{Colors.OKCYAN}Generating SQL query...{Colors.ENDC}")
-            response = requests.post(self.groq_base_url, headers=headers, json=payload, timeout=30)
+            response = self._http.post(self.groq_base_url, headers=headers, json=payload, timeout=30)
             
             if response.status_code == 200:
                 result = response.json()
                 masked_sql_query = result['choices'][0]['message']['content'].strip()
-                masked_sql_query = re.sub(r'```sql\n?', '', masked_sql_query)
-                masked_sql_query = re.sub(r'```\n?', '', masked_sql_query)
-                masked_sql_query = masked_sql_query.strip()
+                masked_sql_query = _MD_FENCE_RE.sub('', masked_sql_query).strip()
                 
                 # Unmask the generated query before returning
                 original_sql_query = self.masking_manager.unmask_sql_query(masked_sql_query)
@@ -1826,9 +1986,15 @@ class SQLGenerator:
         try:
             self.db_connection = sqlite3.connect(db_path)
             self.db_connection.row_factory = sqlite3.Row
+            for pragma in DATABASE_PRAGMAS:
+                self.db_connection.execute(pragma)
             self.db_path = db_path
+            self._schema_cache = None
             self.data_quality_checker = DataQualityChecker(self.db_connection)
+            self._last_dq_results = None
             print(f"{Colors.OKGREEN}✓ Connected to database: {db_path}{Colors.ENDC}")
+            # Build the original and masked schema once, ahead of the first generated query
+            self.get_database_schema()
             return True
         except sqlite3.Error as e:
             print(f"{Colors.FAIL}Database connection error: {str(e)}{Colors.ENDC}")
@@ -1838,37 +2004,35 @@ class SQLGenerator:
         """Get database schema information and build masking mappings"""
         if not self.db_connection:
             return "", ""
+        # The schema only changes through execute_query or a new connection, which both reset the cache
+        if self._schema_cache is not None:
+            return self._schema_cache
 
         try:
-            cursor = self.db_connection.cursor()
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-            tables = cursor.fetchall()
+            # One statement for every table's columns instead of a PRAGMA round-trip per table
+            rows = self.db_connection.execute(
+                "SELECT m.name, p.name, p.type FROM sqlite_master AS m, pragma_table_info(m.name) AS p "
+                "WHERE m.type = 'table' ORDER BY m.rowid, p.cid"
+            )
+            columns_by_table = {}
+            for table_name, col_name, col_type in rows:
+                columns_by_table.setdefault(table_name, []).append((col_name, col_type))
 
             original_schema_info = []
             masked_schema_info = []
+            mask_column_name = self.masking_manager.mask_column_name
 
-            for table in tables:
-                original_table_name = table[0]
+            for original_table_name, columns in columns_by_table.items():
                 masked_table_name = self.masking_manager.mask_table_name(original_table_name)
-                
-                cursor.execute(f"PRAGMA table_info({original_table_name});")
-                columns = cursor.fetchall()
-                
-                original_column_info = []
-                masked_column_info = []
-                
-                for col in columns:
-                    original_col_name = col[1]
-                    col_type = col[2]
-                    masked_col_name = self.masking_manager.mask_column_name(original_table_name, original_col_name)
-                    
-                    original_column_info.append(f"{original_col_name} {col_type}")
-                    masked_column_info.append(f"{masked_col_name} {col_type}")
-                
-                original_schema_info.append(f"Table: {original_table_name} ({', '.join(original_column_info)})")
-                masked_schema_info.append(f"Table: {masked_table_name} ({', '.join(masked_column_info)})")
+                original_columns = ', '.join(f"{col_name} {col_type}" for col_name, col_type in columns)
+                masked_columns = ', '.join(
+                    f"{mask_column_name(original_table_name, col_name)} {col_type}" for col_name, col_type in columns
+                )
+                original_schema_info.append(f"Table: {original_table_name} ({original_columns})")
+                masked_schema_info.append(f"Table: {masked_table_name} ({masked_columns})")
 
-            return "\n".join(original_schema_info), "\n".join(masked_schema_info)
+            self._schema_cache = ("\n".join(original_schema_info), "\n".join(masked_schema_info))
+            return self._schema_cache
 
         except sqlite3.Error as e:
             print(f"{Colors.WARNING}Warning: Could not retrieve schema: {str(e)}{Colors.ENDC}")
@@ -1881,12 +2045,21 @@ class SQLGenerator:
             print(f"{Colors.FAIL}Error: No database connection{Colors.ENDC}")
             return False
 
+        is_select = _SELECT_RE.match(query) is not None
+        # Ask before running a SELECT so its rows can be printed as they stream in;
+        # they are only kept in memory when they are going to be stored
+        store_results = False
+        if is_select:
+            store_choice = input(f"{Colors.OKCYAN}Store the results in Results database? (y/n): {Colors.ENDC}").strip().lower()
+            store_results = store_choice == 'y'
+
         try:
             cursor = self.db_connection.cursor()
             cursor.execute(query)
             
-            if query.strip().upper().startswith('SELECT'):
-                results = cursor.fetchall()
+            if is_select:
+                cursor.arraysize = 1000
+                results = cursor.fetchmany()
                 if results:
                     column_names = [description[0] for description in cursor.description]
                     print(f"\n{Colors.OKGREEN}Query Results:{Colors.ENDC}")
@@ -1895,19 +2068,25 @@ class SQLGenerator:
                     print(f"{Colors.BOLD}{header}{Colors.ENDC}")
                     print("-" * 80)
                     
-                    for row in results:
-                        row_str = " | ".join(f"{str(val):15}" for val in row)
-                        print(row_str)
+                    # Each batch of rows is formatted and written once
+                    # One %-format per row, same padding as f"{str(val):15}" per cell
+                    row_format = " | ".join(["%-15s"] * len(column_names)) + "\n"
+                    stored_rows = []
+                    row_count = 0
+                    while results:
+                        sys.stdout.write("".join(row_format % tuple(row) for row in results))
+                        row_count += len(results)
+                        if store_results:
+                            stored_rows.extend(results)
+                        results = cursor.fetchmany()
                     
                     print("-" * 80)
-                    print(f"{Colors.OKCYAN}Total rows: {len(results)}{Colors.ENDC}")
+                    print(f"{Colors.OKCYAN}Total rows: {row_count}{Colors.ENDC}")
                     
-                    # Ask if user wants to store results
-                    store_choice = input(f"\n{Colors.OKCYAN}Store these results in Results database? (y/n): {Colors.ENDC}").strip().lower()
-                    if store_choice == 'y':
+                    if store_results:
                         description = input(f"{Colors.OKCYAN}Enter description for this result set (optional): {Colors.ENDC}").strip()
                         stored_table = self.results_manager.store_query_results(
-                            query, results, column_names, description
+                            query, stored_rows, column_names, description
                         )
                         if stored_table:
                             print(f"{Colors.OKGREEN}✓ Results successfully stored in Results.db{Colors.ENDC}")
@@ -1915,6 +2094,10 @@ class SQLGenerator:
                     print(f"{Colors.WARNING}No results found{Colors.ENDC}")
             else:
                 self.db_connection.commit()
+                self._schema_cache = None
+                self._last_dq_results = None
+                if self.data_quality_checker:
+                    self.data_quality_checker.invalidate_schema_cache()
                 print(f"{Colors.OKGREEN}✓ Query executed successfully. Rows affected: {cursor.rowcount}{Colors.ENDC}")
             
             return True
@@ -1940,11 +2123,53 @@ class SQLGenerator:
 
         success = self.data_quality_checker.load_checks_config(csv_path)
         if success:
+            self._last_dq_results = None
             print(f"{Colors.OKGREEN}✓ Data quality configuration loaded successfully{Colors.ENDC}")
             run_checks = input(f"{Colors.OKCYAN}Run data quality checks now? (y/n): {Colors.ENDC}").strip().lower()
             if run_checks == 'y':
                 self.run_data_quality_checks()
 
+    def _run_all_checks(self, message: str, reuse: bool = True) -> Optional[Dict[str, List[CheckResult]]]:
+        """Run every configured check, or reuse the last run's results when nothing has changed since.
+
+        With nothing to reuse the user is asked before running; None means they declined.
+        """
+        if reuse:
+            if self._last_dq_results is not None:
+                print(f"{Colors.OKCYAN}Using results from the last data quality run (option 8 runs the checks again){Colors.ENDC}")
+                return self._last_dq_results
+            run_choice = input(f"{Colors.OKCYAN}No data quality results yet. Run the checks now? (y/n): {Colors.ENDC}").strip().lower()
+            if run_choice != 'y':
+                return None
+
+        print(f"{Colors.OKCYAN}{message}{Colors.ENDC}")
+        self._last_dq_results = self.data_quality_checker.run_all_checks()
+        return self._last_dq_results
+
+    def _prompt_export(self, results: Dict[str, List[CheckResult]]):
+        """Ask how to export a set of check results and export them to CSV and/or the Results database"""
+        print(f"\n{Colors.BOLD}Export Options:{Colors.ENDC}")
+        export_choice = input(f"{Colors.OKCYAN}Choose export option:\n1. Export to CSV\n2. Export to Results database\n3. Both\n4. Skip\nEnter choice (1-4): {Colors.ENDC}").strip()
+        
+        if export_choice in ['1', '3']:
+            self.data_quality_checker.export_results_to_csv(results)
+        
+        if export_choice in ['2', '3']:
+            # Ask what to export to database
+            db_export_choice = input(f"{Colors.OKCYAN}Export to database:\n1. Failed checks only\n2. Passed checks only\n3. Both\nEnter choice (1-3): {Colors.ENDC}").strip()
+            
+            # Both tables are written in one Results.db transaction
+            with self.results_manager.transaction():
+                if db_export_choice in ['1', '3']:
+                    success = self.data_quality_checker.export_failed_checks_to_results_db(results, self.results_manager)
+                    if success:
+                        print(f"{Colors.OKGREEN}✓ Failed checks exported to Results database{Colors.ENDC}")
+                
+                if db_export_choice in ['2', '3']:
+                    success = self.data_quality_checker.export_passed_checks_to_results_db(results, self.results_manager)
+                    if success:
+                        print(f"{Colors.OKGREEN}✓ Passed checks exported to Results database{Colors.ENDC}")
+
     def run_data_quality_checks(self):
         """Run all configured data quality checks"""
         if not self.data_quality_checker:
@@ -1955,33 +2180,13 @@ class SQLGenerator:
             print(f"{Colors.WARNING}No data quality checks configured. Please load configuration first.{Colors.ENDC}")
             return
 
-        print(f"{Colors.OKCYAN}Running data quality checks...{Colors.ENDC}")
-        results = self.data_quality_checker.run_all_checks()
+        results = self._run_all_checks("Running data quality checks...", reuse=False)
 
         self.data_quality_checker.print_results(results)
         self.data_quality_checker.print_fields_status_summary(results)
 
         if results:
-            print(f"\n{Colors.BOLD}Export Options:{Colors.ENDC}")
-            export_choice = input(f"{Colors.OKCYAN}Choose export option:\n1. Export to CSV\n2. Export to Results database\n3. Both\n4. Skip\nEnter choice (1-4): {Colors.ENDC}").strip()
-            
-            if export_choice in ['1', '3']:
-                self.data_quality_checker.export_results_to_csv(results)
-            
-            if export_choice in ['2', '3']:
-                # Ask what to export to database
-                db_export_choice = input(f"{Colors.OKCYAN}Export to database:\n1. Failed checks only\n2. Passed checks only\n3. Both\nEnter choice (1-3): {Colors.ENDC}").strip()
-                
-                if db_export_choice in ['1', '3']:
-                    success = self.data_quality_checker.export_failed_checks_to_results_db(results, self.results_manager)
-                    if success:
-                        print(f"{Colors.OKGREEN}✓ Failed checks exported to Results database{Colors.ENDC}")
-                
-                if db_export_choice in ['2', '3']:
-                    success = self.data_quality_checker.export_passed_checks_to_results_db(results, self.results_manager)
-                    if success:
-                        print(f"{Colors.OKGREEN}✓ Passed checks exported to Results database{Colors.ENDC}")
-
+            self._prompt_export(results)
 
     def run_table_specific_checks(self):
         """Run data quality checks for a specific table"""
@@ -1993,24 +2198,24 @@ class SQLGenerator:
             print(f"{Colors.WARNING}No data quality checks configured. Please load configuration first.{Colors.ENDC}")
             return
 
-        available_tables = list(self.data_quality_checker.checks_config.keys())
+        # checks_config is keyed by table in load order, so it serves both the listing and the lookup
+        checks_config = self.data_quality_checker.checks_config
         print(f"\n{Colors.OKCYAN}Available tables with configured checks:{Colors.ENDC}")
-        for i, table in enumerate(available_tables, 1):
-            print(f"{i}. {table}")
+        sys.stdout.write("".join(f"{i}. {table}\n" for i, table in enumerate(checks_config, 1)))
 
         table_choice = input(f"\n{Colors.OKCYAN}Enter table name or number: {Colors.ENDC}").strip()
 
         if table_choice.isdigit():
             table_index = int(table_choice) - 1
-            if 0 <= table_index < len(available_tables):
-                table_name = available_tables[table_index]
+            if 0 <= table_index < len(checks_config):
+                table_name = list(checks_config)[table_index]
             else:
                 print(f"{Colors.FAIL}Invalid table number{Colors.ENDC}")
                 return
         else:
             table_name = table_choice
 
-        if table_name not in available_tables:
+        if table_name not in checks_config:
             print(f"{Colors.FAIL}Table '{table_name}' not found in configuration{Colors.ENDC}")
             return
 
@@ -2020,29 +2225,7 @@ class SQLGenerator:
         if results:
             self.data_quality_checker.print_results(results)
             self.data_quality_checker.print_fields_status_summary(results)
-            
-            # Add export options here too
-            print(f"\n{Colors.BOLD}Export Options:{Colors.ENDC}")
-            export_choice = input(f"{Colors.OKCYAN}Choose export option:\n1. Export to CSV\n2. Export to Results database\n3. Both\n4. Skip\nEnter choice (1-4): {Colors.ENDC}").strip()
-            
-            if export_choice in ['1', '3']:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"data_quality_report_{table_name}_{timestamp}.csv"
-                self.data_quality_checker.export_results_to_csv(results)
-            
-            if export_choice in ['2', '3']:
-                # Ask what to export to database
-                db_export_choice = input(f"{Colors.OKCYAN}Export to database:\n1. Failed checks only\n2. Passed checks only\n3. Both\nEnter choice (1-3): {Colors.ENDC}").strip()
-                
-                if db_export_choice in ['1', '3']:
-                    success = self.data_quality_checker.export_failed_checks_to_results_db(results, self.results_manager)
-                    if success:
-                        print(f"{Colors.OKGREEN}✓ Failed checks exported to Results database{Colors.ENDC}")
-                
-                if db_export_choice in ['2', '3']:
-                    success = self.data_quality_checker.export_passed_checks_to_results_db(results, self.results_manager)
-                    if success:
-                        print(f"{Colors.OKGREEN}✓ Passed checks exported to Results database{Colors.ENDC}")
+            self._prompt_export(results)
         else:
             print(f"{Colors.WARNING}No results found for table '{table_name}'{Colors.ENDC}")
 
@@ -2056,8 +2239,9 @@ class SQLGenerator:
             print(f"{Colors.WARNING}No data quality checks configured. Please load configuration first.{Colors.ENDC}")
             return
 
-        print(f"{Colors.OKCYAN}Running data quality checks to identify failed fields...{Colors.ENDC}")
-        results = self.data_quality_checker.run_all_checks()
+        results = self._run_all_checks("Running data quality checks to identify failed fields...")
+        if results is None:
+            return
 
         if not results:
             print(f"{Colors.WARNING}No data quality issues found{Colors.ENDC}")
@@ -2069,31 +2253,26 @@ class SQLGenerator:
             print(f"{Colors.OKGREEN}✓ No fields have failed data quality checks!{Colors.ENDC}")
             return
 
-        print(f"\n{Colors.BOLD}{Colors.FAIL}{'='*60}{Colors.ENDC}")
-        print(f"{Colors.BOLD}{Colors.FAIL}FAILED FIELDS REPORT{Colors.ENDC}")
-        print(f"{Colors.BOLD}{Colors.FAIL}{'='*60}{Colors.ENDC}")
-
-        total_failed_fields = 0
+        # The whole report is formatted first and written once
+        rule = f"{Colors.BOLD}{Colors.FAIL}{'='*60}{Colors.ENDC}"
+        total_failed_fields = sum(len(fields) for fields in failed_fields.values())
+        lines = ["", rule, f"{Colors.BOLD}{Colors.FAIL}FAILED FIELDS REPORT{Colors.ENDC}", rule]
         for table_name, fields in failed_fields.items():
-            total_failed_fields += len(fields)
-            print(f"\n{Colors.BOLD}{Colors.FAIL}Table: {table_name}{Colors.ENDC}")
-            print(f"{Colors.FAIL}Failed fields: {len(fields)}{Colors.ENDC}")
-            print("-" * 40)
+            lines.append(f"\n{Colors.BOLD}{Colors.FAIL}Table: {table_name}{Colors.ENDC}")
+            lines.append(f"{Colors.FAIL}Failed fields: {len(fields)}{Colors.ENDC}")
+            lines.append("-" * 40)
 
             for field_name, failed_checks_list in fields.items():
-                failed_checks_str = ", ".join(failed_checks_list)
-                print(f"  {Colors.FAIL}• {field_name}{Colors.ENDC}")
-                print(f"    Failed checks: {failed_checks_str}")
-
-        print(f"\n{Colors.BOLD}{Colors.FAIL}{'='*60}{Colors.ENDC}")
-        print(f"{Colors.BOLD}{Colors.FAIL}TOTAL FAILED FIELDS: {total_failed_fields}{Colors.ENDC}")
-        print(f"{Colors.BOLD}{Colors.FAIL}{'='*60}{Colors.ENDC}")
+                lines.append(f"  {Colors.FAIL}• {field_name}{Colors.ENDC}")
+                lines.append(f"    Failed checks: {', '.join(failed_checks_list)}")
+        lines += ["", rule, f"{Colors.BOLD}{Colors.FAIL}TOTAL FAILED FIELDS: {total_failed_fields}{Colors.ENDC}", rule]
+        sys.stdout.write("\n".join(lines) + "\n")
 
         detailed_choice = input(f"\n{Colors.OKCYAN}Show detailed results for failed fields? (y/n): {Colors.ENDC}").strip().lower()
         if detailed_choice == 'y':
             failed_results = {}
             for table_name, table_results in results.items():
-                failed_table_results = [r for r in table_results if r['status'] in ['FAIL', 'ERROR']]
+                failed_table_results = [r for r in table_results if r.status in FAILED_STATUSES]
                 if failed_table_results:
                     failed_results[table_name] = failed_table_results
 
@@ -2147,193 +2326,217 @@ class SQLGenerator:
 
     def show_masking_mappings(self):
         """Display current masking mappings"""
-        print(f"\n{Colors.BOLD}DATA MASKING MAPPINGS{Colors.ENDC}")
-        print("=" * 50)
+        lines = [f"\n{Colors.BOLD}DATA MASKING MAPPINGS{Colors.ENDC}", "=" * 50]
         
-        print(f"\n{Colors.BOLD}Table Mappings:{Colors.ENDC}")
+        lines.append(f"\n{Colors.BOLD}Table Mappings:{Colors.ENDC}")
         for original, masked in self.masking_manager.table_mapping.items():
-            print(f"  {original} → {masked}")
+            lines.append(f"  {original} → {masked}")
         
-        print(f"\n{Colors.BOLD}Column Mappings:{Colors.ENDC}")
+        lines.append(f"\n{Colors.BOLD}Column Mappings:{Colors.ENDC}")
         for table, columns in self.masking_manager.column_mapping.items():
-            print(f"  Table: {table}")
+            lines.append(f"  Table: {table}")
             for original_col, masked_col in columns.items():
-                print(f"    {original_col} → {masked_col}")
-
-    def run(self):
-        """Main application loop - UPDATED TO HANDLE OPTIONS 1-19"""
-        self.print_banner()
-        
-        while True:
-            self.show_menu()
-            choice = input(f"{Colors.BOLD}Enter your choice (1-19): {Colors.ENDC}").strip()
-
-            if choice == '1':
-                if not self.groq_api_key:
-                    print(f"{Colors.FAIL}Error: Groq API key not configured. Please set it first (option 12){Colors.ENDC}")
-                    continue
-
-                if not self.db_connection:
-                    print(f"{Colors.FAIL}Error: No database connection. Please connect first (option 3){Colors.ENDC}")
-                    continue
+                lines.append(f"    {original_col} → {masked_col}")
+        # Every mapping is written with a single call
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    def generate_and_execute_query(self):
+        """Generate a SQL query from a natural-language request and optionally execute it"""
+        user_request = input(f"{Colors.OKCYAN}Enter your query request: {Colors.ENDC}")
+        if not user_request:
+            return
 
-                user_request = input(f"{Colors.OKCYAN}Enter your query request: {Colors.ENDC}")
-                if not user_request:
-                    continue
+        original_schema_info, masked_schema_info = self.get_database_schema()
+        sql_query = self.generate_sql_query(user_request, original_schema_info, masked_schema_info)
 
-                original_schema_info, masked_schema_info = self.get_database_schema()
-                sql_query = self.generate_sql_query(user_request, original_schema_info, masked_schema_info)
+        if sql_query:
+            print(f"\n{Colors.OKGREEN}Generated SQL Query:{Colors.ENDC}")
+            print(f"{Colors.BOLD}{sql_query}{Colors.ENDC}")
+            
+            execute_choice = input(f"{Colors.OKCYAN}Execute this query? (y/n): {Colors.ENDC}").strip().lower()
+            if execute_choice == 'y':
+                self.execute_query(sql_query)
 
-                if sql_query:
-                    print(f"\n{Colors.OKGREEN}Generated SQL Query:{Colors.ENDC}")
-                    print(f"{Colors.BOLD}{sql_query}{Colors.ENDC}")
-                    
-                    execute_choice = input(f"{Colors.OKCYAN}Execute this query? (y/n): {Colors.ENDC}").strip().lower()
-                    if execute_choice == 'y':
-                        self.execute_query(sql_query)
+    def enter_manual_query(self):
+        """Read a multi-line SQL query from the user and execute it"""
+        print(f"{Colors.OKCYAN}Enter SQL query (press Enter twice to execute, or type :paste to read until EOF):{Colors.ENDC}")
+        first_line = input()
+        if first_line.strip() == ':paste':
+            # Pasted text is read in one go, blank lines included, up to Ctrl-D
+            query = sys.stdin.read().strip()
+        else:
+            lines = [first_line]
+            while True:
+                line = input()
+                if line == "" and lines:
+                    break
+                lines.append(line)
+
+            query = "\n".join(lines).strip()
+        if query:
+            self.execute_query(query)
+
+    def show_database_schema(self):
+        """Display the schema of the connected database"""
+        schema = self.get_database_schema()
+        if schema:
+            print(f"\n{Colors.OKGREEN}Database Schema:{Colors.ENDC}")
+            print(f"{Colors.BOLD}{schema}{Colors.ENDC}")
+        else:
+            print(f"{Colors.WARNING}No tables found in database{Colors.ENDC}")
+
+    def create_sample_tables(self):
+        """Create the sample tables after confirmation"""
+        confirm = input(f"{Colors.WARNING}This will create/overwrite sample tables. Continue? (y/n): {Colors.ENDC}").strip().lower()
+        if confirm == 'y':
+            self.create_sample_database()
+
+    def export_failing_values_only(self):
+        """Export the failing values of every configured check to CSV"""
+        results = self._run_all_checks("Running data quality checks to export failing values...")
+        if results is None:
+            return
+        if results:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"failing_values_only_{timestamp}.csv"
+            self.data_quality_checker.export_failing_values_to_csv(results, filename)
+        else:
+            print(f"{Colors.OKBLUE}No data quality issues found{Colors.ENDC}")
+
+    def set_api_key(self):
+        """Replace the Groq API key"""
+        new_api_key = input(f"{Colors.OKCYAN}Enter Groq API key: {Colors.ENDC}").strip()
+        if new_api_key:
+            self.groq_api_key = new_api_key
+            print(f"{Colors.OKGREEN}✓ Groq API key updated{Colors.ENDC}")
+        else:
+            print(f"{Colors.WARNING}No API key provided{Colors.ENDC}")
 
+    def export_failed_checks_menu(self):
+        """Run the configured checks and store the failed ones in the Results database"""
+        if not self.data_quality_checker.checks_config:
+            print(f"{Colors.WARNING}No data quality checks configured. Please load configuration first.{Colors.ENDC}")
+            return
+        
+        results = self._run_all_checks("Running data quality checks to export failed checks to Results database...")
+        if results is None:
+            return
+        
+        if results:
+            success = self.data_quality_checker.export_failed_checks_to_results_db(results, self.results_manager)
+            if success:
+                print(f"{Colors.OKGREEN}✓ Failed checks successfully exported to Results database{Colors.ENDC}")
+        else:
+            print(f"{Colors.OKBLUE}No data quality issues found to export{Colors.ENDC}")
 
-            elif choice == '2':
-                # [Keep your existing code for option 2]
-                if not self.db_connection:
-                    print(f"{Colors.FAIL}Error: No database connection. Please connect first (option 3){Colors.ENDC}")
-                    continue
+    def export_passed_checks_menu(self):
+        """Run the configured checks and store the passed ones in the Results database"""
+        if not self.data_quality_checker.checks_config:
+            print(f"{Colors.WARNING}No data quality checks configured. Please load configuration first.{Colors.ENDC}")
+            return
+        
+        results = self._run_all_checks("Running data quality checks to export passed checks to Results database...")
+        if results is None:
+            return
+        
+        if results:
+            success = self.data_quality_checker.export_passed_checks_to_results_db(results, self.results_manager)
+            if success:
+                print(f"{Colors.OKGREEN}✓ Passed checks successfully exported to Results database{Colors.ENDC}")
+        else:
+            print(f"{Colors.OKBLUE}No data quality check results found to export{Colors.ENDC}")
 
-                print(f"{Colors.OKCYAN}Enter SQL query (press Enter twice to execute):{Colors.ENDC}")
-                lines = []
-                while True:
-                    line = input()
-                    if line == "" and lines:
-                        break
-                    lines.append(line)
-
-                query = "\n".join(lines).strip()
-                if query:
-                    self.execute_query(query)
-
-            # [Keep all your existing elif cases for options 3-12 exactly as they are]
-            elif choice == '3':
-                self.connect_database()
-            elif choice == '4':
-                if not self.db_connection:
-                    print(f"{Colors.FAIL}Error: No database connection. Please connect first (option 3){Colors.ENDC}")
-                    continue
-                schema = self.get_database_schema()
-                if schema:
-                    print(f"\n{Colors.OKGREEN}Database Schema:{Colors.ENDC}")
-                    print(f"{Colors.BOLD}{schema}{Colors.ENDC}")
-                else:
-                    print(f"{Colors.WARNING}No tables found in database{Colors.ENDC}")
-            elif choice == '5':
-                if not self.db_connection:
-                    print(f"{Colors.FAIL}Error: No database connection. Please connect first (option 3){Colors.ENDC}")
-                    continue
-                confirm = input(f"{Colors.WARNING}This will create/overwrite sample tables. Continue? (y/n): {Colors.ENDC}").strip().lower()
-                if confirm == 'y':
-                    self.create_sample_database()
-            elif choice == '6':
-                if not self.db_connection:
-                    print(f"{Colors.FAIL}Error: No database connection. Please connect first (option 3){Colors.ENDC}")
-                    continue
-                self.load_data_quality_config()
-            elif choice == '7':
-                if not self.db_connection:
-                    print(f"{Colors.FAIL}Error: No database connection. Please connect first (option 3){Colors.ENDC}")
-                    continue
-                self.load_system_codes_config()
-            elif choice == '8':
-                if not self.db_connection:
-                    print(f"{Colors.FAIL}Error: No database connection. Please connect first (option 3){Colors.ENDC}")
-                    continue
-                self.run_data_quality_checks()
-            elif choice == '9':
-                if not self.db_connection:
-                    print(f"{Colors.FAIL}Error: No database connection. Please connect first (option 3){Colors.ENDC}")
-                    continue
-                self.run_table_specific_checks()
-            elif choice == '10':
-                if not self.db_connection:
-                    print(f"{Colors.FAIL}Error: No database connection. Please connect first (option 3){Colors.ENDC}")
-                    continue
-                self.show_failed_fields_only()
-            elif choice == '11':
-                if not self.db_connection:
-                    print(f"{Colors.FAIL}Error: No database connection. Please connect first (option 3){Colors.ENDC}")
-                    continue
-                print(f"{Colors.OKCYAN}Running data quality checks to export failing values...{Colors.ENDC}")
-                results = self.data_quality_checker.run_all_checks()
-                if results:
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    filename = f"failing_values_only_{timestamp}.csv"
-                    self.data_quality_checker.export_failing_values_to_csv(results, filename)
-                else:
-                    print(f"{Colors.OKBLUE}No data quality issues found{Colors.ENDC}")
-            elif choice == '12':
-                new_api_key = input(f"{Colors.OKCYAN}Enter Groq API key: {Colors.ENDC}").strip()
-                if new_api_key:
-                    self.groq_api_key = new_api_key
-                    print(f"{Colors.OKGREEN}✓ Groq API key updated{Colors.ENDC}")
-                else:
-                    print(f"{Colors.WARNING}No API key provided{Colors.ENDC}")
-            
-            # NEW OPTIONS 13-16
-            elif choice == '13':
-                self.view_stored_results_menu()
+    def run_batch_checks(self, table_name: str = None, export_csv: bool = False, export_db: str = None) -> int:
+        """Run the configured checks without the menu, export as requested and return an exit status:
+        0 if every check passed, 1 on setup errors, 2 if any check failed or errored"""
+        if not self.data_quality_checker:
+            print(f"{Colors.FAIL}Error: No database connection. Use --db-path{Colors.ENDC}")
+            return 1
 
-            elif choice == '14':
-                self.results_manager.list_stored_results()
+        if not self.data_quality_checker.checks_config:
+            print(f"{Colors.FAIL}Error: No data quality checks configured. Use --quality-config{Colors.ENDC}")
+            return 1
 
-            elif choice == '15':
-                self.delete_stored_results_menu()
+        if table_name:
+            if table_name not in self.data_quality_checker.checks_config:
+                print(f"{Colors.FAIL}Error: No configuration found for table: {table_name}{Colors.ENDC}")
+                return 1
+            print(f"{Colors.OKCYAN}Running checks for table: {table_name}...{Colors.ENDC}")
+            results = self.data_quality_checker.run_checks_for_specific_table(table_name)
+        else:
+            results = self._run_all_checks("Running data quality checks...", reuse=False)
 
-            elif choice == '16':
-                if not self.db_connection:
-                    print(f"{Colors.FAIL}Error: No database connection. Please connect first (option 3){Colors.ENDC}")
-                    continue
-                if not self.data_quality_checker.checks_config:
-                    print(f"{Colors.WARNING}No data quality checks configured. Please load configuration first.{Colors.ENDC}")
-                    continue
-                
-                print(f"{Colors.OKCYAN}Running data quality checks to export failed checks to Results database...{Colors.ENDC}")
-                results = self.data_quality_checker.run_all_checks()
-                
-                if results:
-                    success = self.data_quality_checker.export_failed_checks_to_results_db(results, self.results_manager)
-                    if success:
-                        print(f"{Colors.OKGREEN}✓ Failed checks successfully exported to Results database{Colors.ENDC}")
-                else:
-                    print(f"{Colors.OKBLUE}No data quality issues found to export{Colors.ENDC}")
+        self.data_quality_checker.print_results(results)
+        self.data_quality_checker.print_fields_status_summary(results)
 
-            elif choice == '17':
-                if not self.db_connection:
-                    print(f"{Colors.FAIL}Error: No database connection. Please connect first (option 3){Colors.ENDC}")
-                    continue
-                if not self.data_quality_checker.checks_config:
-                    print(f"{Colors.WARNING}No data quality checks configured. Please load configuration first.{Colors.ENDC}")
-                    continue
-                
-                print(f"{Colors.OKCYAN}Running data quality checks to export passed checks to Results database...{Colors.ENDC}")
-                results = self.data_quality_checker.run_all_checks()
-                
-                if results:
-                    success = self.data_quality_checker.export_passed_checks_to_results_db(results, self.results_manager)
-                    if success:
-                        print(f"{Colors.OKGREEN}✓ Passed checks successfully exported to Results database{Colors.ENDC}")
-                else:
-                    print(f"{Colors.OKBLUE}No data quality check results found to export{Colors.ENDC}")
+        if results:
+            if export_csv:
+                self.data_quality_checker.export_results_to_csv(results)
+            if export_db:
+                with self.results_manager.transaction():
+                    if export_db in ('failed', 'both'):
+                        self.data_quality_checker.export_failed_checks_to_results_db(results, self.results_manager)
+                    if export_db in ('passed', 'both'):
+                        self.data_quality_checker.export_passed_checks_to_results_db(results, self.results_manager)
+
+        self.db_connection.close()
+        self.results_manager.close()
+        # A distinct status lets a pipeline tell failed checks apart from usage errors
+        if any(result.status in FAILED_STATUSES for table_results in results.values() for result in table_results):
+            return 2
+        return 0
 
-            elif choice == '18':
-                self.show_masking_mappings()
+    def run(self):
+        """Main application loop - UPDATED TO HANDLE OPTIONS 1-19"""
+        self.print_banner()
+        
+        # Menu choice -> (handler, prerequisites); option 19 exits the loop
+        menu = {
+            '1': (self.generate_and_execute_query, NEEDS_API | NEEDS_DB),
+            '2': (self.enter_manual_query, NEEDS_DB),
+            '3': (self.connect_database, 0),
+            '4': (self.show_database_schema, NEEDS_DB),
+            '5': (self.create_sample_tables, NEEDS_DB),
+            '6': (self.load_data_quality_config, NEEDS_DB),
+            '7': (self.load_system_codes_config, NEEDS_DB),
+            '8': (self.run_data_quality_checks, NEEDS_DB),
+            '9': (self.run_table_specific_checks, NEEDS_DB),
+            '10': (self.show_failed_fields_only, NEEDS_DB),
+            '11': (self.export_failing_values_only, NEEDS_DB),
+            '12': (self.set_api_key, 0),
+            '13': (self.view_stored_results_menu, 0),
+            '14': (self.results_manager.list_stored_results, 0),
+            '15': (self.delete_stored_results_menu, 0),
+            '16': (self.export_failed_checks_menu, NEEDS_DB),
+            '17': (self.export_passed_checks_menu, NEEDS_DB),
+            '18': (self.show_masking_mappings, 0),
+        }
+        
+        while True:
+            self.show_menu()
+            choice = input(f"{Colors.BOLD}Enter your choice (1-19): {Colors.ENDC}").strip()
 
-            elif choice == '19':  # Updated exit option;;
+            if choice == '19':
                 if self.db_connection:
                     self.db_connection.close()
                 self.results_manager.close()
                 print(f"{Colors.OKGREEN}✓ Database connections closed{Colors.ENDC}")
                 print(f"{Colors.OKBLUE}Thank you for using SQL Code Generator!{Colors.ENDC}")
-                break 
-            else:
+                break
+
+            entry = menu.get(choice)
+            if entry is None:
                 print(f"{Colors.FAIL}Invalid choice. Please enter a number between 1 and 19.{Colors.ENDC}")
+                continue
+
+            handler, needs = entry
+            if needs & NEEDS_API and not self.groq_api_key:
+                print(f"{Colors.FAIL}Error: Groq API key not configured. Please set it first (option 12){Colors.ENDC}")
+                continue
+            if needs & NEEDS_DB and not self.db_connection:
+                print(f"{Colors.FAIL}Error: No database connection. Please connect first (option 3){Colors.ENDC}")
+                continue
+            handler()
 # [Keep your existing main function exactly as it is]
 
 def main():
@@ -2344,6 +2547,14 @@ def main():
     parser.add_argument('--db-path', help='Path to SQLite database file')
     parser.add_argument('--create-sample', action='store_true', help='Create sample database on startup')
     parser.add_argument('--quality-config', help='Path to data quality checks CSV configuration file')
+    parser.add_argument('--system-codes-config', help='Path to system codes CSV configuration file')
+    
+    # Any of these runs the checks once without the interactive menu and exits
+    batch = parser.add_argument_group('batch mode', 'Exit status: 0 if every check passed, 1 on setup errors, 2 if any check failed or errored')
+    batch.add_argument('--run-checks', action='store_true', help='Run the configured data quality checks and exit')
+    batch.add_argument('--table', help='Only check this configured table')
+    batch.add_argument('--export-csv', action='store_true', help='Export the check results to CSV')
+    batch.add_argument('--export-db', choices=['failed', 'passed', 'both'], help='Export the check results to the Results database')
     
     args = parser.parse_args()
     
@@ -2361,6 +2572,15 @@ def main():
         else:
             print(f"{Colors.FAIL}Error: Quality config file '{args.quality_config}' not found{Colors.ENDC}")
     
+    if args.system_codes_config and generator.db_connection:
+        if os.path.exists(args.system_codes_config):
+            generator.data_quality_checker.load_system_codes_config(args.system_codes_config)
+        else:
+            print(f"{Colors.FAIL}Error: System codes config file '{args.system_codes_config}' not found{Colors.ENDC}")
+    
+    if args.run_checks or args.table or args.export_csv or args.export_db:
+        sys.exit(generator.run_batch_checks(args.table, args.export_csv, args.export_db))
+    
     try:
         generator.run()
     except KeyboardInterrupt: